@@ -4,6 +4,8 @@ All ORM models import _Base from this module so that SQLAlchemy's metadata
 is unified under one DeclarativeBase instance.  All tables live in a single
 database file (screamsheet.db).
 
+Engines are shared per database path through engine_for().
+
 DB path resolution order:
     1. SCREAMSHEET_DB environment variable (if set)
     2. Platform default: ~/database/screamsheet.db  (Linux / macOS)
@@ -12,8 +14,12 @@ DB path resolution order:
 
 import os
 import sys
+import threading
+from collections import OrderedDict
 from pathlib import Path
+from typing import Callable
 
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import DeclarativeBase
 
 
@@ -21,6 +27,11 @@ class _Base(DeclarativeBase):
     pass
 
 
+# Held around every write to the database file.  SQLite allows one writer at
+# a time, and player lookups upsert from several threads at once.
+_WRITE_LOCK = threading.Lock()
+
+
 def get_db_path() -> Path:
     """Return the resolved path to the screamsheet SQLite database.
 
@@ -33,3 +44,39 @@ def get_db_path() -> Path:
     if sys.platform.startswith("win"):
         return Path("C:/database/screamsheet.db")
     return Path.home() / "database" / "screamsheet.db"
+
+
+# A run touches one database; the headroom covers tests and the sync scripts.
+_MAX_ENGINES = 4
+_engines: "OrderedDict[Path, Engine]" = OrderedDict()
+_engines_lock = threading.Lock()
+
+
+def engine_for(path: Path, init_db: Callable[[Path], Engine]) -> Engine:
+    """Return the shared engine for path, creating it with init_db on first use.
+
+    Lookups in a hot loop then reuse one connection pool instead of building
+    an engine and re-checking the schema on every call.  Every table hangs
+    off _Base.metadata, so one engine serves both the players and teams
+    modules.  At most _MAX_ENGINES are kept; the least recently used one is
+    disposed when a new path pushes it out.  Creation happens under a lock so
+    concurrent first lookups do not race on CREATE TABLE.
+    """
+    with _engines_lock:
+        engine = _engines.get(path)
+        if engine is not None:
+            _engines.move_to_end(path)
+            return engine
+        engine = _engines[path] = init_db(path)
+        if len(_engines) > _MAX_ENGINES:
+            _, stale = _engines.popitem(last=False)
+            stale.dispose()
+        return engine
+
+
+def dispose_engines() -> None:
+    """Dispose and forget every engine handed out by engine_for()."""
+    with _engines_lock:
+        while _engines:
+            _, engine = _engines.popitem()
+            engine.dispose()
@@ -15,7 +15,8 @@ Table schema:
 Lookup priority (via lookup_player):
     1. player_id exact match
     2. last_name case-insensitive (+ optional first_name filter)
-    3. NHL API /player/{id}/landing on cache-miss — result is auto-upserted
+    3. NHL API /player/{id}/landing on cache-miss — result is auto-upserted;
+       each player_id is fetched successfully at most once per process
 
 Name collisions:
     lookup_player_by_name() returns ALL matches as a List[Dict].  The caller
@@ -24,17 +25,18 @@ Name collisions:
     the ``team`` or ``position`` field to disambiguate.
 """
 
-import json
 import logging
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import orjson
 import requests
 from sqlalchemy import Column, Integer, String, Text, create_engine, text
 from sqlalchemy.orm import Session
 
-from ._nhl_db_shared import _Base, get_db_path
+from ._nhl_db_shared import _WRITE_LOCK, _Base, engine_for, get_db_path
 
 logger = logging.getLogger(__name__)
 
@@ -81,8 +83,8 @@ def init_db(db_path: Optional[Path] = None):
 
 
 def _get_engine(db_path: Optional[Path] = None):
-    """Return an engine for db_path, creating the DB/table if necessary."""
-    return init_db(db_path)
+    """Return the shared engine for db_path, creating the DB/table if necessary."""
+    return engine_for(db_path or get_db_path(), init_db)
 
 
 # ---------------------------------------------------------------------------
@@ -107,7 +109,7 @@ def upsert_players(players: List[Dict], db_path: Optional[Path] = None) -> int:
     engine = _get_engine(db_path)
     now = datetime.now(timezone.utc).isoformat()
     count = 0
-    with Session(engine) as session:
+    with _WRITE_LOCK, Session(engine) as session:
         for p in players:
             pid = p.get("player_id")
             if pid is None:
@@ -190,21 +192,42 @@ def lookup_player_by_name(
 # API fallback
 # ---------------------------------------------------------------------------
 
+# Successful API lookups for the life of the process, keyed by player_id.
+# Failures are not kept: a timeout or 5xx must not pin a player as unknown
+# for every later game in the run.
+_player_api_hits: Dict[int, Dict] = {}
+_player_api_hits_lock = threading.Lock()
+
+
 def _fetch_player_from_api(player_id: int) -> Optional[Dict]:
-    """Fetch a single player from NHL API and return an upsert-ready dict."""
+    """Fetch a single player from NHL API and return an upsert-ready dict.
+
+    Successful lookups are memoised for the life of the process, so each
+    player costs at most one request per run; failed lookups are retried on
+    the next call.
+    """
+    with _player_api_hits_lock:
+        hit = _player_api_hits.get(player_id)
+    if hit is not None:
+        return hit
+    # Deferred: the providers package imports this one at load time.
+    from ..providers._http import pooled_get
     try:
         url = _NHL_PLAYER_API.format(player_id=player_id)
-        res = requests.get(url, timeout=5)
+        res = pooled_get(url, timeout=5)
         res.raise_for_status()
-        info = res.json()
-        return {
+        info = orjson.loads(res.content)
+        player = {
             "player_id":         player_id,
             "player_first_name": info.get("firstName", {}).get("default", "Unknown"),
             "player_last_name":  info.get("lastName", {}).get("default", "Player"),
             "position":          info.get("position", ""),
             "team":              info.get("currentTeamAbbrev", ""),
-            "raw_json":          json.dumps(info),
+            "raw_json":          res.content.decode("utf-8"),
         }
+        with _player_api_hits_lock:
+            _player_api_hits[player_id] = player
+        return player
     except (requests.exceptions.RequestException, KeyError, ValueError) as exc:
         logger.warning(
             "_fetch_player_from_api: failed to fetch player %d: %s", player_id, exc
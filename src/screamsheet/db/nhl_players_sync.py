@@ -21,6 +21,7 @@ from typing import List, Optional
 
 import requests
 
+from ..providers._http import pooled_get
 from .nhl_players_db import get_db_path, init_db, upsert_players
 
 logger = logging.getLogger(__name__)
@@ -38,7 +39,7 @@ def fetch_all_team_abbreviations() -> List[str]:
         requests.exceptions.HTTPError: on a non-2xx response.
     """
     url = f"{_BASE_URL}/standings/now"
-    response = requests.get(url, timeout=10)
+    response = pooled_get(url, timeout=10)
     response.raise_for_status()
     data = response.json()
 
@@ -65,7 +66,7 @@ def fetch_team_roster(team_abbrev: str) -> List[dict]:
     """
     url = f"{_BASE_URL}/roster/{team_abbrev}/current"
     try:
-        response = requests.get(url, timeout=10)
+        response = pooled_get(url, timeout=10)
         response.raise_for_status()
         data = response.json()
     except requests.exceptions.RequestException as exc:
@@ -24,7 +24,7 @@ from typing import Dict, List, Optional
 from sqlalchemy import Column, Integer, String, Text, create_engine, text
 from sqlalchemy.orm import Session
 
-from ._nhl_db_shared import _Base, get_db_path
+from ._nhl_db_shared import _WRITE_LOCK, _Base, engine_for, get_db_path
 
 logger = logging.getLogger(__name__)
 
@@ -67,7 +67,8 @@ def init_db(db_path: Optional[Path] = None):
 
 
 def _get_engine(db_path: Optional[Path] = None):
-    return init_db(db_path)
+    """Return the shared engine for db_path, creating the DB/table if necessary."""
+    return engine_for(db_path or get_db_path(), init_db)
 
 
 # ---------------------------------------------------------------------------
@@ -92,7 +93,7 @@ def upsert_teams(teams: List[Dict], db_path: Optional[Path] = None) -> int:
     engine = _get_engine(db_path)
     now = datetime.now(timezone.utc).isoformat()
     count = 0
-    with Session(engine) as session:
+    with _WRITE_LOCK, Session(engine) as session:
         for t in teams:
             tid = t.get("team_id")
             if tid is None:
@@ -4,7 +4,7 @@ Public API — prefer importing from here rather than from sub-modules::
 
     from screamsheet.llm import NHLGameSummarizer, LLMConfig
 """
-from .config import LLMConfig, DEFAULT_LLM_CONFIG
+from .config import LLMConfig, DEFAULT_LLM_CONFIG, NEWS_LLM_CONFIG
 from .base import BaseGameSummaryGenerator, ExtractedInfo, PromptChainInput
 from .summarizers import (
     NHLGameSummarizer,
@@ -22,6 +22,7 @@ from .summarizers import (
 __all__ = [
     "LLMConfig",
     "DEFAULT_LLM_CONFIG",
+    "NEWS_LLM_CONFIG",
     "BaseGameSummaryGenerator",
     "ExtractedInfo",
     "PromptChainInput",
@@ -6,26 +6,29 @@ implement only ``_build_llm_prompt(data)``.
 Callers that previously imported from ``llm.summary`` continue to work
 unchanged — ``llm/summary.py`` re-exports everything from here.
 """
-import json
 import logging
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from typing import TYPE_CHECKING, Dict, Any, Iterator, List, Optional, Sequence, Tuple, Union
 
+import orjson
 from dotenv import load_dotenv
 load_dotenv()
 
-from langchain_openai import ChatOpenAI
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import StrOutputParser
-from langchain_core.runnables import (
-    Runnable,
-    RunnableLambda,
-    RunnablePassthrough,
-)
+from langchain_core.prompt_values import StringPromptValue
+from langchain_core.runnables import Runnable, RunnableLambda
 
+from . import response_cache
 from .config import LLMConfig, DEFAULT_LLM_CONFIG
 
+# The provider SDKs pull in the Google and OpenAI client stacks, which
+# dominate import time; they are imported when a client is first built, so
+# runs that never call an LLM (string data, no key, dummy mode) skip them.
+if TYPE_CHECKING:
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    from langchain_openai import ChatOpenAI
+
 # ---------------------------------------------------------------------------
 # Module logger
 # ---------------------------------------------------------------------------
@@ -47,6 +50,71 @@ ExtractedInfo = Dict[str, Any]
 PromptChainInput = Dict[str, Any]
 
 
+def prompt_data_json(data: ExtractedInfo) -> str:
+    """Serialize *data* the way it is embedded in the LLM prompt.
+
+    Compact (no indentation): whitespace is billed as input tokens and the
+    model reads minified JSON just as well.  Non-string keys are stringified,
+    as ``json.dumps`` would.
+    """
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
+# Stateless and identical for every summarizer: built once at import.
+_PROMPT_FORMAT = "Here is the input data:\n\n{game_data}\n\nInstruction: {prompt_text}"
+_STR_PARSER = StrOutputParser()
+
+
+# ---------------------------------------------------------------------------
+# Shared chat clients
+# ---------------------------------------------------------------------------
+# A sheet creates several summarizers (one per news section, one per game),
+# all talking to the same provider with the same settings.  Sharing one chat
+# client per configuration means they share its HTTP connection pool, so
+# only the first request to each API pays for the TCP/TLS handshake.
+
+@lru_cache(maxsize=None)
+def _gemini_client(
+    model: str,
+    temperature: float,
+    api_key: str,
+    timeout: float,
+    max_retries: int,
+) -> "ChatGoogleGenerativeAI":
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    return ChatGoogleGenerativeAI(
+        model=model,
+        temperature=temperature,
+        google_api_key=api_key,
+        timeout=timeout,
+        max_retries=max_retries,
+    )
+
+
+@lru_cache(maxsize=None)
+def _grok_client(
+    model: str,
+    temperature: float,
+    api_key: str,
+    base_url: str,
+    extra_headers: Tuple[Tuple[str, str], ...],
+    timeout: float,
+    max_retries: int,
+) -> "ChatOpenAI":
+    from langchain_openai import ChatOpenAI
+
+    return ChatOpenAI(
+        model=model,
+        temperature=temperature,
+        openai_api_key=api_key,
+        base_url=base_url,
+        model_kwargs={"extra_headers": dict(extra_headers)},
+        timeout=timeout,
+        max_retries=max_retries,
+    )
+
+
 class BaseGameSummaryGenerator:
     """
     Base class for LLM-powered summarizers.
@@ -84,34 +152,52 @@ class BaseGameSummaryGenerator:
             "gemini": gemini_api_key,
             "grok": grok_api_key,
         }
-        self.llm_gemini = self._initialize_gemini(gemini_api_key)
-        self.llm_grok = self._initialize_grok(grok_api_key)
         self._cwd = Path.cwd()
+        # Assembled pipelines keyed by LLM choice; see _pipeline_for()
+        self._pipelines: Dict[str, Runnable] = {}
 
     # ------------------------------------------------------------------
     # LLM initialisation
     # ------------------------------------------------------------------
 
+    # Chat clients are built on first use: constructing them sets up
+    # credentials and HTTP clients, which is wasted on summarizers that
+    # never reach generation (string data, no key, tests).
+
+    @cached_property
+    def llm_gemini(self) -> Optional["ChatGoogleGenerativeAI"]:
+        """Gemini chat model, or ``None`` when no Gemini key was given."""
+        return self._initialize_gemini(self.api_keys["gemini"])
+
+    @cached_property
+    def llm_grok(self) -> Optional["ChatOpenAI"]:
+        """Grok chat model, or ``None`` when no Grok key was given."""
+        return self._initialize_grok(self.api_keys["grok"])
+
     def _initialize_gemini(
         self, api_key: Optional[str]
-    ) -> Optional[ChatGoogleGenerativeAI]:
+    ) -> Optional["ChatGoogleGenerativeAI"]:
         if not api_key:
             return None
-        return ChatGoogleGenerativeAI(
-            model=self.config.gemini_model,
-            temperature=self.config.gemini_temperature,
-            google_api_key=api_key,
+        return _gemini_client(
+            self.config.gemini_model,
+            self.config.gemini_temperature,
+            api_key,
+            self.config.request_timeout,
+            self.config.max_retries,
         )
 
-    def _initialize_grok(self, api_key: Optional[str]) -> Optional[ChatOpenAI]:
+    def _initialize_grok(self, api_key: Optional[str]) -> Optional["ChatOpenAI"]:
         if not api_key:
             return None
-        return ChatOpenAI(
-            model=self.config.grok_model,
-            temperature=self.config.grok_temperature,
-            openai_api_key=api_key,
-            base_url=self.config.grok_base_url,
-            model_kwargs={"extra_headers": self.config.grok_extra_headers},
+        return _grok_client(
+            self.config.grok_model,
+            self.config.grok_temperature,
+            api_key,
+            self.config.grok_base_url,
+            tuple(sorted(self.config.grok_extra_headers.items())),
+            self.config.request_timeout,
+            self.config.max_retries,
         )
 
     # ------------------------------------------------------------------
@@ -136,79 +222,238 @@ class BaseGameSummaryGenerator:
     # ------------------------------------------------------------------
 
     def _setup_prompt_chain(self) -> Runnable:
-        """Build a reusable LangChain prompt-assembly chain."""
-        input_prep_chain = RunnablePassthrough.assign(
-            game_data=RunnableLambda(lambda x: json.dumps(x["data"], indent=2)),
-            prompt_text=RunnableLambda(lambda x: self._build_llm_prompt(x["data"])),
-        )
-        template = PromptTemplate.from_template(
-            "Here is the input data:\n\n{game_data}\n\nInstruction: {prompt_text}"
+        """Build a reusable LangChain prompt-assembly chain.
+
+        A single runnable renders the whole prompt with one string format,
+        rather than an assign step of per-field lambdas feeding a template.
+        """
+        return RunnableLambda(self._render_prompt)
+
+    def _render_prompt(self, chain_input: PromptChainInput) -> StringPromptValue:
+        """Return the complete prompt for ``chain_input["data"]``."""
+        data = chain_input["data"]
+        return StringPromptValue(
+            text=_PROMPT_FORMAT.format(
+                game_data=prompt_data_json(data),
+                prompt_text=self._build_llm_prompt(data),
+            )
         )
-        return input_prep_chain | template
 
     def _build_llm_prompt(self, data: ExtractedInfo) -> str:
         """Return the prompt string for *data*.  Subclasses must override."""
         raise NotImplementedError("Subclass must implement '_build_llm_prompt'")
 
+    @cached_property
+    def _prompt_chain(self) -> Runnable:
+        """The prompt-assembly chain, built once per summarizer."""
+        return self._setup_prompt_chain()
+
+    def _build_pipeline(self, llm_instance: Runnable) -> Runnable:
+        """Return a rendered prompt piped through *llm_instance* to a string."""
+        return llm_instance | _STR_PARSER
+
+    def _pipeline_for(self, llm_choice: str) -> Runnable:
+        """Return the model pipeline for *llm_choice*, assembling it on first use."""
+        key = llm_choice.lower()
+        pipeline = self._pipelines.get(key)
+        if pipeline is None:
+            pipeline = self._build_pipeline(self._select_llm_instance(key))
+            self._pipelines[key] = pipeline
+        return pipeline
+
     # ------------------------------------------------------------------
     # Generation
     # ------------------------------------------------------------------
 
+    def _model_name(self, llm_choice: str) -> str:
+        """Return the configured model name behind *llm_choice*."""
+        if llm_choice.lower() == "grok":
+            return self.config.grok_model
+        return self.config.gemini_model
+
     def _generate_llm_summary(
-        self, data: Union[ExtractedInfo, str], llm_choice: str
+        self, data: Union[ExtractedInfo, str], llm_choice: str, cache: bool = True
     ) -> str:
-        """Run the full generation pipeline and return the summary string."""
+        """Run the full generation pipeline and return the summary string.
+
+        With *cache* on, a summary generated earlier for the identical
+        prompt and model is returned from the on-disk response cache, and
+        fresh summaries are written to it.
+        """
         if isinstance(data, str):
             return data
 
         try:
-            llm_instance: Runnable = self._select_llm_instance(llm_choice)
-
-            full_pipeline = (
-                self._setup_prompt_chain() | llm_instance | StrOutputParser()
-            )
-
             chain_input: PromptChainInput = {"data": data, "llm_choice": llm_choice}
 
-            # Log a prompt preview at DEBUG level only (best-effort)
-            try:
-                prompt_builder = self._setup_prompt_chain()
-                try:
-                    prompt_preview = prompt_builder.invoke(chain_input)
-                    if hasattr(prompt_preview, "to_string"):
-                        prompt_preview = prompt_preview.to_string()
-                    else:
-                        prompt_preview = str(prompt_preview)
-                    logger.debug(
-                        "LLM prompt preview (trimmed 4000 chars):\n%s",
-                        prompt_preview[:4000],
-                    )
-                    logger.debug("Full LLM prompt length: %d", len(prompt_preview))
-                except Exception as exc:
-                    logger.debug("Could not render LLM prompt preview: %s", exc)
-            except Exception:
-                pass
+            # Render the prompt once: the preview below and the LLM call both
+            # use this value, so the data is serialized a single time.
+            prompt_value = self._prompt_chain.invoke(chain_input)
+
+            # Log a prompt preview at DEBUG level only
+            if logger.isEnabledFor(logging.DEBUG):
+                prompt_preview = prompt_value.to_string()
+                logger.debug(
+                    "LLM prompt preview (trimmed 4000 chars):\n%s",
+                    prompt_preview[:4000],
+                )
+                logger.debug("Full LLM prompt length: %d", len(prompt_preview))
 
             if not llm_choice:
                 return self.config.default_text
 
-            summary: str = full_pipeline.invoke(chain_input)
+            key = self._cache_key(llm_choice, prompt_value) if cache else None
+            if key is not None:
+                cached = response_cache.read_cached(key)
+                if cached is not None:
+                    logger.info("LLM summary served from cache (via %s)", llm_choice)
+                    return cached
+
+            summary: str = self._pipeline_for(llm_choice).invoke(prompt_value)
             word_count = len(summary.split())
             logger.info("LLM summary generated: %d words (via %s)", word_count, llm_choice)
+            if key is not None:
+                response_cache.write_cached(key, summary)
             return summary
 
-        except ValueError as ve:
-            logger.error("LLM configuration error: %s", ve)
-            return "Summary generation failed due to configuration issue."
         except Exception as exc:
-            logger.error("LLM summary generation failed: %s", exc)
-            return "Summary generation failed."
+            return self._failure_text(exc)
+
+    def _cache_key(self, llm_choice: str, prompt_value: StringPromptValue) -> str:
+        """Return the response-cache key for *prompt_value* sent to *llm_choice*."""
+        return response_cache.cache_key(
+            llm_choice, self._model_name(llm_choice), prompt_value.to_string()
+        )
+
+    @staticmethod
+    def _failure_text(exc: Exception) -> str:
+        """Log *exc* and return the placeholder text shown instead of a summary."""
+        if isinstance(exc, ValueError):
+            logger.error("LLM configuration error: %s", exc)
+            return "Summary generation failed due to configuration issue."
+        logger.error("LLM summary generation failed: %s", exc)
+        return "Summary generation failed."
 
     def generate_summary(
         self,
         llm_choice: str = "gemini",
         data: Union[ExtractedInfo, str] = {"data": "dummy"},
+        cache: bool = True,
         **kwargs,
     ) -> str:
-        """Public entry point: generate and return the summary string."""
-        return self._generate_llm_summary(data, llm_choice)
+        """Public entry point: generate and return the summary string.
+
+        Pass ``cache=False`` to bypass the on-disk response cache and force
+        a fresh model call.
+        """
+        return self._generate_llm_summary(data, llm_choice, cache=cache)
+
+    def generate_summaries(
+        self,
+        items: Sequence[Tuple[Union[ExtractedInfo, str], str]],
+        cache: bool = True,
+    ) -> List[str]:
+        """Generate one summary per ``(data, llm_choice)`` pair, in order.
+
+        Per-item results match :meth:`generate_summary`, response cache
+        included: string *data* is returned unchanged, a prompt answered
+        earlier comes from disk, and a failed item gets the failure text
+        without affecting the others.  The remaining items for each LLM go
+        through one pipeline ``.batch()`` call, so their requests are in
+        flight together (bounded by ``config.batch_max_concurrency``).
+        """
+        results: Dict[int, str] = {}
+        # llm_choice -> [(item index, rendered prompt, cache key)]
+        pending: Dict[str, List[Tuple[int, StringPromptValue, Optional[str]]]] = {}
+        for i, (data, llm_choice) in enumerate(items):
+            if isinstance(data, str):
+                results[i] = data
+                continue
+            if not llm_choice:
+                results[i] = self.config.default_text
+                continue
+            try:
+                prompt_value = self._prompt_chain.invoke({"data": data, "llm_choice": llm_choice})
+                key = self._cache_key(llm_choice, prompt_value) if cache else None
+            except Exception as exc:
+                results[i] = self._failure_text(exc)
+                continue
+            if key is not None:
+                cached = response_cache.read_cached(key)
+                if cached is not None:
+                    logger.info("LLM summary served from cache (via %s)", llm_choice)
+                    results[i] = cached
+                    continue
+            pending.setdefault(llm_choice, []).append((i, prompt_value, key))
+
+        for llm_choice, group in pending.items():
+            try:
+                outputs: List[Any] = self._pipeline_for(llm_choice).batch(
+                    [prompt_value for _, prompt_value, _ in group],
+                    config={"max_concurrency": self.config.batch_max_concurrency},
+                    return_exceptions=True,
+                )
+            except Exception as exc:
+                outputs = [exc] * len(group)
+            for (i, _, key), output in zip(group, outputs):
+                if isinstance(output, Exception):
+                    results[i] = self._failure_text(output)
+                    continue
+                logger.info(
+                    "LLM summary generated: %d words (via %s)", len(output.split()), llm_choice
+                )
+                if key is not None:
+                    response_cache.write_cached(key, output)
+                results[i] = output
+
+        return [results[i] for i in range(len(items))]
+
+    def generate_summary_stream(
+        self,
+        llm_choice: str = "gemini",
+        data: Union[ExtractedInfo, str] = {"data": "dummy"},
+        cache: bool = True,
+    ) -> Iterator[str]:
+        """Yield the summary in chunks as the LLM produces them.
+
+        Same prompt and response cache as :meth:`generate_summary`, but the
+        first chunk is available as soon as the model starts answering
+        instead of after the whole response.  A cached summary is yielded
+        as a single chunk, and a fully streamed one is written to the
+        cache.  String *data* is yielded unchanged; if generation fails
+        before any text arrives, the same failure message as the blocking
+        path is yielded instead.
+        """
+        if isinstance(data, str):
+            yield data
+            return
+
+        if not llm_choice:
+            yield self.config.default_text
+            return
+
+        parts: List[str] = []
+        words = 0
+        try:
+            chain_input: PromptChainInput = {"data": data, "llm_choice": llm_choice}
+            prompt_value = self._prompt_chain.invoke(chain_input)
+
+            key = self._cache_key(llm_choice, prompt_value) if cache else None
+            if key is not None:
+                cached = response_cache.read_cached(key)
+                if cached is not None:
+                    logger.info("LLM summary served from cache (via %s)", llm_choice)
+                    yield cached
+                    return
+
+            for chunk in self._pipeline_for(llm_choice).stream(prompt_value):
+                parts.append(chunk)
+                words += len(chunk.split())
+                yield chunk
+            logger.info("LLM summary streamed: ~%d words (via %s)", words, llm_choice)
+            if key is not None:
+                response_cache.write_cached(key, "".join(parts))
+        except Exception as exc:
+            logger.error("LLM summary streaming failed: %s", exc)
+            if not parts:
+                yield "Summary generation failed."
@@ -32,6 +32,18 @@ class LLMConfig:
     grok_temperature: float = 0.3
     grok_extra_headers: dict = field(default_factory=lambda: {"x-search-mode": "auto"})
 
+    # --- Request budget (both providers) -------------------------------
+    # Hard per-request timeout in seconds, so a hung socket can't stall a
+    # sheet, and how many times the client SDK retries rate limits (429),
+    # server errors (5xx), and timeouts, with exponential backoff.
+    request_timeout: float = 30.0
+    max_retries: int = 3
+
+    # --- Batching -------------------------------------------------------
+    # Upper bound on in-flight requests for generate_summaries(); a news
+    # section summarizes at most four articles.
+    batch_max_concurrency: int = 4
+
     # --- Fallback / debug ---------------------------------------------
     # Returned when no LLM key is configured (keeps tests and dry-runs clean)
     default_text: str = "howdy, folks.  test text here"
@@ -39,3 +51,7 @@ class LLMConfig:
 
 # Module-level singleton — import this in all production code paths.
 DEFAULT_LLM_CONFIG = LLMConfig()
+
+# Short RSS-blurb summaries don't need Flash-level reasoning; the lite tier
+# answers faster and costs less per token.  Game recaps stay on the default.
+NEWS_LLM_CONFIG = LLMConfig(gemini_model="gemini-2.5-flash-lite")
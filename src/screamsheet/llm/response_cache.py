@@ -0,0 +1,71 @@
+"""On-disk cache of generated LLM summaries.
+
+The same article or game is often summarized again on the same day (cron
+retries, re-runs after a layout tweak).  Summaries are stored as one text
+file per prompt, keyed by a hash of the LLM choice, model name, and the
+fully rendered prompt, so an identical prompt is answered from disk
+instead of another paid model call.  Entries older than CACHE_TTL are
+ignored and overwritten on the next successful generation.
+
+Cache directory resolution order:
+    1. SCREAMSHEET_LLM_CACHE environment variable (if set)
+    2. ``llm_cache/`` next to the screamsheet database
+       (see ``screamsheet.db._nhl_db_shared.get_db_path``)
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Optional
+
+from ..db._nhl_db_shared import get_db_path
+
+logger = logging.getLogger("screamsheet.llm")
+
+# Long enough to cover same-day re-runs; short enough that stale takes age out.
+CACHE_TTL = timedelta(days=1)
+
+
+def get_cache_dir() -> Path:
+    """Return the directory holding cached summaries."""
+    env = os.environ.get("SCREAMSHEET_LLM_CACHE")
+    if env:
+        return Path(env)
+    return get_db_path().parent / "llm_cache"
+
+
+def cache_key(llm_choice: str, model: str, prompt_text: str) -> str:
+    """Return the cache key for one rendered prompt sent to one model."""
+    digest = hashlib.blake2b(digest_size=20)
+    for part in (llm_choice.lower(), model, prompt_text):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def read_cached(key: str) -> Optional[str]:
+    """Return the cached summary for *key*, or ``None`` if absent or expired."""
+    path = get_cache_dir() / f"{key}.txt"
+    try:
+        if time.time() - path.stat().st_mtime > CACHE_TTL.total_seconds():
+            return None
+        return path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def write_cached(key: str, text: str) -> None:
+    """Store *text* under *key*; failures are logged and otherwise ignored."""
+    directory = get_cache_dir()
+    path = directory / f"{key}.txt"
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as exc:
+        logger.debug("Could not write LLM cache entry %s: %s", path, exc)
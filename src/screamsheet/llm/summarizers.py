@@ -14,16 +14,23 @@ Adding a new input source
 3. Wire it where needed (provider's ``get_game_summary`` or a renderer's
    ``fetch_data``), passing the matching ``ExtractedInfo`` dict.
 """
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from .base import BaseGameSummaryGenerator, ExtractedInfo
-from .config import LLMConfig, DEFAULT_LLM_CONFIG
+from .config import LLMConfig, DEFAULT_LLM_CONFIG, NEWS_LLM_CONFIG
 
 # Absolute path to the prompts directory next to this file
 _PROMPTS_DIR = Path(__file__).parent / "prompts"
 
 
+@lru_cache(maxsize=None)
+def _load_prompt(name: Path) -> str:
+    """Return the text of ``llm/prompts/<name>``, read from disk once per process."""
+    return (_PROMPTS_DIR / name).read_text(encoding="utf-8")
+
+
 class FilePromptMixin:
     """
     Mixin that loads ``_build_llm_prompt`` from a versioned ``.txt`` file.
@@ -31,13 +38,19 @@ class FilePromptMixin:
     The prompt file lives at ``llm/prompts/<_PROMPT_FILE>``.  Any ``{key}``
     placeholders in the file are filled via ``str.format_map(data)``.
     Keys that are absent from *data* are left as literals so the prompt
-    doesn't crash on partially-populated inputs.
+    doesn't crash on partially-populated inputs.  Templates are read once
+    per process and reused by every instance; templates without any
+    placeholders are returned as-is.
     """
 
     _PROMPT_FILE: Path  # must be set by concrete class
 
     def _build_llm_prompt(self, data: ExtractedInfo) -> str:
-        template = (_PROMPTS_DIR / self._PROMPT_FILE).read_text(encoding="utf-8")
+        template = _load_prompt(self._PROMPT_FILE)
+        if "{" not in template and "}" not in template:
+            # Static prompt (news.txt, political_news.txt, ...): nothing to
+            # fill, so hand back the cached text itself.
+            return template
         try:
             return template.format_map(data)
         except KeyError:
@@ -212,6 +225,9 @@ class NewsSummarizer(FilePromptMixin, BaseGameSummaryGenerator):
     -----------------------
     - News article: ``{'title': str, 'summary': str, 'link': str, ...}``
     - Ad-hoc:       ``{'summary': str}``  (e.g., Players Tribune title gen)
+
+    Defaults to :data:`~screamsheet.llm.config.NEWS_LLM_CONFIG`, which uses
+    the lighter Gemini model.
     """
 
     _PROMPT_FILE = Path("news.txt")
@@ -220,7 +236,7 @@ class NewsSummarizer(FilePromptMixin, BaseGameSummaryGenerator):
         self,
         gemini_api_key: Optional[str] = None,
         grok_api_key: Optional[str] = None,
-        config: LLMConfig = DEFAULT_LLM_CONFIG,
+        config: LLMConfig = NEWS_LLM_CONFIG,
     ) -> None:
         BaseGameSummaryGenerator.__init__(
             self,
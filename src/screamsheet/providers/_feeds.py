@@ -0,0 +1,136 @@
+"""Conditional-GET RSS fetching shared by the news providers.
+
+Feeds are polled on every run but mostly change a few times a day.  After
+each successful parse the feed's ``ETag`` / ``Last-Modified`` validators and
+the entry fields the providers read are stored on disk as JSON; the next fetch sends them back as
+``If-None-Match`` / ``If-Modified-Since``, and a ``304 Not Modified`` reply
+is answered from the stored entries with no body transfer and no XML parse.
+Stored entries come back as plain dicts holding only ``_ENTRY_FIELDS`` and
+``_TIME_FIELDS``.
+
+Usage::
+
+    feed = feedparser.parse(url, **conditional_headers(url))
+    entries = feed_entries(url, feed)
+
+Cache directory resolution order:
+    1. SCREAMSHEET_FEED_CACHE environment variable (if set)
+    2. ``feed_cache/`` next to the screamsheet database
+       (see ``screamsheet.db._nhl_db_shared.get_db_path``)
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import orjson
+
+from ..db._nhl_db_shared import get_db_path
+
+logger = logging.getLogger(__name__)
+
+# Entry fields read downstream (providers and DataProvider.sanitize_entry).
+_ENTRY_FIELDS = ("id", "title", "link", "summary", "description")
+# time.struct_time fields; stored as lists of their nine integers.
+_TIME_FIELDS = ("published_parsed", "updated_parsed")
+
+
+def get_feed_cache_dir() -> Path:
+    """Return the directory holding stored feed validators and entries."""
+    env = os.environ.get("SCREAMSHEET_FEED_CACHE")
+    if env:
+        return Path(env)
+    return get_db_path().parent / "feed_cache"
+
+
+def _state_path(url: str) -> Path:
+    name = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+    return get_feed_cache_dir() / f"{name}.json"
+
+
+def _freeze_entry(entry: Any) -> Dict[str, Any]:
+    """Return the JSON-safe subset of a feedparser entry."""
+    frozen: Dict[str, Any] = {
+        k: entry.get(k) for k in _ENTRY_FIELDS if isinstance(entry.get(k), str)
+    }
+    for k in _TIME_FIELDS:
+        value = entry.get(k)
+        if value:
+            frozen[k] = list(value)
+    return frozen
+
+
+def _thaw_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of :func:`_freeze_entry`; time fields become struct_time again."""
+    for k in _TIME_FIELDS:
+        if entry.get(k):
+            entry[k] = time.struct_time(entry[k])
+    return entry
+
+
+def _load_state(url: str) -> Optional[Dict[str, Any]]:
+    try:
+        state = orjson.loads(_state_path(url).read_bytes())
+    except (OSError, ValueError):
+        return None
+    return state if isinstance(state, dict) else None
+
+
+def _store_state(url: str, state: Dict[str, Any]) -> None:
+    path = _state_path(url)
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(orjson.dumps(state))
+        os.replace(tmp, path)
+    except (OSError, ValueError) as exc:
+        logger.debug("Could not store feed state for %s: %s", url, exc)
+
+
+def conditional_headers(url: str) -> Dict[str, str]:
+    """Return the ``etag`` / ``modified`` kwargs for ``feedparser.parse(url)``.
+
+    Empty when nothing is stored for url, so the first fetch is a plain GET.
+    """
+    state = _load_state(url)
+    if not state:
+        return {}
+    return {k: state[k] for k in ("etag", "modified") if state.get(k)}
+
+
+def feed_entries(url: str, feed: Any) -> Sequence[Any]:
+    """Return the entries for a feed fetched with :func:`conditional_headers`.
+
+    On ``304 Not Modified`` the stored entries are returned as plain dicts.
+    Otherwise the fresh entries are returned and, when the server sent a
+    validator, their fields are stored together with it for the next run.
+
+    Args:
+        url:  Feed URL passed to ``feedparser.parse``.
+        feed: The parsed result.
+
+    Returns:
+        The feed's entries.
+    """
+    if feed.get("status") == 304:
+        state = _load_state(url)
+        if state:
+            logger.debug("Feed not modified: %s", url)
+            stored: List[Dict[str, Any]] = state.get("entries") or []
+            return [_thaw_entry(entry) for entry in stored]
+
+    entries = feed.entries
+    etag = feed.get("etag")
+    modified = feed.get("modified")
+    if isinstance(etag, str) or isinstance(modified, str):
+        entries = list(entries)
+        _store_state(url, {
+            "etag": etag if isinstance(etag, str) else None,
+            "modified": modified if isinstance(modified, str) else None,
+            "entries": [_freeze_entry(entry) for entry in entries],
+        })
+    return entries
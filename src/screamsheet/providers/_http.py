@@ -0,0 +1,173 @@
+"""Shared HTTP helpers for the sports data providers.
+
+Schedule and box-score payloads from the MLB StatsAPI and the NHL web API
+run from tens to hundreds of KB, so decoding is done with orjson straight
+from the raw response bytes rather than through ``Response.json()``.
+
+All provider requests share pooled sessions, so consecutive calls to the
+same host reuse one TCP/TLS connection, transient connection failures and
+gateway errors (502/503/504) are retried with backoff, and every request
+carries a timeout.
+
+Schedules for past dates and box scores for finished games never change, so
+those lookups go through a disk-backed ``requests_cache.CachedSession``.
+Repeat runs (development, or several sheets asking for the same game) are
+then served from the local cache instead of the network.
+
+Cache path resolution order:
+    1. SCREAMSHEET_HTTP_CACHE environment variable (if set)
+    2. ``http_cache.sqlite`` next to the screamsheet database
+       (see ``screamsheet.db._nhl_db_shared.get_db_path``)
+"""
+
+import logging
+import os
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import orjson
+import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..db._nhl_db_shared import get_db_path
+
+logger = logging.getLogger(__name__)
+
+# Completed games and past schedules are immutable; a week is plenty.
+FINAL_EXPIRE_AFTER = timedelta(days=7)
+# Today's (or future) schedules change as games go final: short-lived entries.
+LIVE_EXPIRE_AFTER = 300
+# (connect, read) seconds applied to every request unless the caller overrides.
+DEFAULT_TIMEOUT = (3, 10)
+
+
+def read_json(response: requests.Response) -> Any:
+    """Decode a JSON response body with orjson.
+
+    Args:
+        response: A completed ``requests`` response.
+
+    Returns:
+        The decoded payload (dict/list structure identical to ``response.json()``).
+
+    Raises:
+        requests.exceptions.JSONDecodeError: If the body is not valid JSON,
+            the same exception ``Response.json()`` raises, so existing
+            ``RequestException`` handlers keep catching it.
+    """
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+
+def get_cache_path() -> Path:
+    """Return the path of the on-disk HTTP cache."""
+    env = os.environ.get("SCREAMSHEET_HTTP_CACHE")
+    if env:
+        return Path(env)
+    return get_db_path().parent / "http_cache.sqlite"
+
+
+# Both APIs serve highly repetitive JSON that compresses well.  Pin the
+# compressed encodings urllib3 can decode (gzip/deflate, plus zstd when the
+# zstandard package is installed) rather than relying on library defaults.
+_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": requests.utils.DEFAULT_ACCEPT_ENCODING,
+}
+
+
+def _configure_session(session: requests.Session) -> None:
+    """Set shared headers and attach a pooled, retrying adapter."""
+    session.headers.update(_HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+@lru_cache(maxsize=1)
+def _get_session() -> requests.Session:
+    """Build the shared uncached session on first use."""
+    session = requests.Session()
+    _configure_session(session)
+    return session
+
+
+@lru_cache(maxsize=1)
+def _get_cached_session() -> requests_cache.CachedSession:
+    """Build the shared cached session on first use."""
+    path = get_cache_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    logger.debug("HTTP cache at %s", path)
+    session = requests_cache.CachedSession(
+        str(path),
+        backend="sqlite",
+        expire_after=FINAL_EXPIRE_AFTER,
+        allowable_codes=(200,),
+        cache_control=True,
+    )
+    _configure_session(session)
+    return session
+
+
+def pooled_get(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    **kwargs: Any,
+) -> requests.Response:
+    """GET url through the shared pooled session.
+
+    Args:
+        url:      Request URL.
+        params:   Optional query parameters.
+        **kwargs: Passed to ``Session.get`` (e.g. ``headers``); ``timeout``
+                  defaults to DEFAULT_TIMEOUT.
+
+    Returns:
+        The response.
+    """
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    return _get_session().get(url, params=params, **kwargs)
+
+
+def expire_after_for(game_date: Union[date, datetime]) -> Union[int, timedelta]:
+    """Return the cache lifetime for a schedule lookup on game_date.
+
+    Past dates get the long lifetime; today and later get LIVE_EXPIRE_AFTER
+    so in-progress games are re-fetched every few minutes.
+    """
+    if isinstance(game_date, datetime):
+        game_date = game_date.date()
+    if game_date < date.today():
+        return FINAL_EXPIRE_AFTER
+    return LIVE_EXPIRE_AFTER
+
+
+def cached_get(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    expire_after: Optional[Union[int, timedelta]] = None,
+) -> requests.Response:
+    """GET url through the shared disk cache.
+
+    Args:
+        url:          Request URL.
+        params:       Optional query parameters (part of the cache key).
+        expire_after: Per-request lifetime; defaults to FINAL_EXPIRE_AFTER.
+
+    Returns:
+        The (possibly cached) response.
+    """
+    kwargs: Dict[str, Any] = {"timeout": DEFAULT_TIMEOUT}
+    if expire_after is not None:
+        kwargs["expire_after"] = expire_after
+    return _get_cached_session().get(url, params=params, **kwargs)
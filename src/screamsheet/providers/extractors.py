@@ -7,51 +7,145 @@ import logging
 import re
 import time
 import requests
-from typing import Optional, Dict, Any, Union, List
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping, Union, List, Tuple
 
 from ..db import lookup_player as _db_lookup_player
 from ..db.nhl_teams_db import lookup_team_by_id as _db_lookup_team
+from ._http import cached_get, expire_after_for, read_json
 
 logger = logging.getLogger(__name__)
 
 ExtractedInfo = Dict[str, Union[str, int]]
 
+# Shared read-only default for per-play .get() chains, so a missing key does
+# not allocate a fresh empty dict on every play.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Play-by-play budget handed to the summarizers.  Prompt size drives LLM
+# latency and cost, and a full game carries far more routine plays than a
+# ~200-word recap can use.
+MAX_NARRATIVE_PLAYS = 40
+MAX_NARRATIVE_CHARS = 8000
+
+
+def _select_narrative(
+    ranked: List[Tuple[int, str]],
+    max_plays: Optional[int] = None,
+    max_chars: int = MAX_NARRATIVE_CHARS,
+) -> str:
+    """Join the most important snippets, in game order, within a budget.
+
+    Args:
+        ranked:    ``(rank, snippet)`` pairs in game order; lower ranks are
+                   kept first, ties go to the earlier play.
+        max_plays: Maximum number of snippets kept (``None`` for no limit).
+        max_chars: Maximum length of the joined string.
+
+    Returns:
+        The kept snippets joined with single spaces.
+    """
+    if (max_plays is None or len(ranked) <= max_plays) and \
+            sum(len(text) + 1 for _, text in ranked) <= max_chars + 1:
+        return " ".join(text for _, text in ranked)
+
+    keep: List[int] = []
+    used = 0
+    for i in sorted(range(len(ranked)), key=lambda i: (ranked[i][0], i)):
+        if max_plays is not None and len(keep) >= max_plays:
+            break
+        cost = len(ranked[i][1]) + 1
+        if used + cost > max_chars + 1:
+            continue
+        keep.append(i)
+        used += cost
+    keep.sort()
+    return " ".join(ranked[i][1] for i in keep)
+
 
 class MLBGameExtractor:
     """Fetches and extracts MLB game data from the MLB Stats API."""
 
-    @staticmethod
-    def fetch_raw_data(team_id: int, date_str: str) -> Optional[Dict[str, Any]]:
-        """Fetch raw live feed data for a team on a given date (YYYY-MM-DD)."""
-        schedule_url = "https://statsapi.mlb.com/api/v1/schedule"
-        params = {'sportId': 1, 'teamId': team_id, 'date': date_str}
+    # StatsAPI ``fields`` filter for feed/live: only the team names/ids,
+    # linescore runs, play results and scoring flags used below (and by
+    # MLBDataProvider.get_game_summary).  The unfiltered feed carries
+    # pitch-by-pitch detail and runs to several MB.
+    FEED_FIELDS = (
+        'gameData,teams,home,away,id,name,'
+        'liveData,linescore,runs,plays,allPlays,result,event,description,rbi,'
+        'about,isScoringPlay'
+    )
+
+    # Narrative ranking: plays that score or drive in a run first, then hits,
+    # then the other notable outcomes, then everything else (groundouts,
+    # flyouts, ...).
+    _HIT_EVENTS = frozenset({"Single", "Double", "Triple"})
+    _KEY_EVENTS = frozenset({"Strikeout", "Walk", "Hit By Pitch"})
 
+    @staticmethod
+    def fetch_raw_data(
+        team_id: int,
+        date_str: str,
+        game_pk: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch raw live feed data for a team on a given date (YYYY-MM-DD).
+
+        Pass game_pk when the caller has already resolved the game to skip
+        the schedule round trip and go straight to the live feed.
+        """
         try:
-            schedule_response = requests.get(schedule_url, params=params)
-            schedule_response.raise_for_status()
-            schedule_data = schedule_response.json()
-
-            game_pk = None
-            if schedule_data.get('totalItems', 0) > 0:
-                for game in schedule_data.get('dates', [{}])[0].get('games', []):
-                    away_id = game.get('teams', {}).get('away', {}).get('team', {}).get('id')
-                    home_id = game.get('teams', {}).get('home', {}).get('team', {}).get('id')
-                    if away_id == team_id or home_id == team_id:
-                        game_pk = game.get('gamePk')
-                        break
+            # Past dates are final and kept for days; today's feed is re-fetched
+            # after a few minutes so a game still in progress is not frozen.
+            expire_after = expire_after_for(date.fromisoformat(date_str))
+
+            if not game_pk:
+                schedule_url = "https://statsapi.mlb.com/api/v1/schedule"
+                params = {'sportId': 1, 'teamId': team_id, 'date': date_str}
+                schedule_response = cached_get(schedule_url, params=params,
+                                               expire_after=expire_after)
+                schedule_response.raise_for_status()
+                schedule_data = read_json(schedule_response)
+
+                # teamId filters the schedule server-side, so every game
+                # returned involves team_id; take the first (game 1 of a
+                # doubleheader).
+                dates = schedule_data.get('dates') or [{}]
+                games = dates[0].get('games', [])
+                if games:
+                    game_pk = games[0].get('gamePk')
 
             if not game_pk:
-                print("No game found for the specified team and date.")
+                logger.info("No MLB game found for team_id=%s on %s", team_id, date_str)
                 return None
 
             game_url = f"https://statsapi.mlb.com/api/v1.1/game/{game_pk}/feed/live"
-            summary_response = requests.get(game_url)
+            summary_response = cached_get(game_url,
+                                          params={'fields': MLBGameExtractor.FEED_FIELDS},
+                                          expire_after=expire_after)
             summary_response.raise_for_status()
-            return summary_response.json()
+            logger.debug("Fetched MLB live feed for game %s", game_pk)
+            return read_json(summary_response)
 
         except requests.exceptions.RequestException as e:
-            print(f"Error fetching MLB game data: {e}")
+            logger.warning("Error fetching MLB game data: %s", e)
             return None
+        except ValueError as e:
+            logger.warning("Invalid MLB game date %r: %s", date_str, e)
+            return None
+
+    @staticmethod
+    def _play_rank(result: Mapping[str, Any], about: Mapping[str, Any]) -> int:
+        event = result.get('event')
+        if (about.get('isScoringPlay') or result.get('rbi') or event == "Home Run"
+                or "scores" in result.get('description', '')):
+            return 0
+        if event in MLBGameExtractor._HIT_EVENTS:
+            return 1
+        if event in MLBGameExtractor._KEY_EVENTS:
+            return 2
+        return 3
 
     @staticmethod
     def extract_key_info(raw_data: Optional[Dict[str, Any]]) -> Union[ExtractedInfo, str]:
@@ -66,32 +160,49 @@ class MLBGameExtractor:
             home_score = raw_data.get('liveData', {}).get('linescore', {}).get('teams', {}).get('home', {}).get('runs', 0)
             away_score = raw_data.get('liveData', {}).get('linescore', {}).get('teams', {}).get('away', {}).get('runs', 0)
 
-            play_by_play: List[str] = []
             plays = raw_data.get('liveData', {}).get('plays', {}).get('allPlays', [])
-            for play in plays:
-                description = play.get('result', {}).get('description', '')
-                if description:
-                    play_by_play.append(description)
+            play_by_play: List[Tuple[int, str]] = [
+                (MLBGameExtractor._play_rank(result, play.get('about', _EMPTY)), description)
+                for play in plays
+                if (description := (result := play.get('result', _EMPTY)).get('description'))
+            ]
 
             return {
                 'home_team': home_team,
                 'away_team': away_team,
                 'home_score': home_score,
                 'away_score': away_score,
-                'narrative_snippets': " ".join(play_by_play),
+                'narrative_snippets': _select_narrative(play_by_play, MAX_NARRATIVE_PLAYS),
             }
         except (KeyError, IndexError, TypeError) as e:
-            print(f"Error parsing MLB game data: {e}")
+            logger.warning("Error parsing MLB game data: %s", e)
             return "Could not parse MLB game details for summary generation."
 
 
 class NHLGameExtractor:
     """Fetches and extracts NHL game data from the NHL Web API.
 
-    Loads player and team name maps from documentation/ on init to avoid
-    repeated API lookups for every play in a game.
+    Player and team names are resolved through the SQLite cache (with NHL
+    API fallback for unknown players) and indexed per instance, so each ID
+    is looked up at most once per game no matter how many plays mention it.
     """
 
+    # Detail keys that carry player IDs on narrative plays.
+    _PLAYER_ID_KEYS = (
+        "scoringPlayerId", "assist1PlayerId", "assist2PlayerId", "goalieInNetId",
+        "hittingPlayerId", "hitteePlayerId", "committedByPlayerId",
+        "drawnByPlayerId", "shootingPlayerId", "playerId",
+    )
+    # Concurrent cold lookups (SQLite read + NHL API fallback) per game.
+    _PREFETCH_WORKERS = 8
+    # Narrative priority when the play-by-play exceeds MAX_NARRATIVE_CHARS.
+    _TYPE_RANK = {"goal": 0, "penalty": 1, "shot-on-goal": 2}
+    _DEFAULT_RANK = 3
+
+    def __init__(self) -> None:
+        self._player_index: Dict[int, str] = {}
+        self._team_index: Dict[int, str] = {}
+
     # ------------------------------------------------------------------
     # Name lookups (DB-backed)
     # ------------------------------------------------------------------
@@ -99,22 +210,30 @@ class NHLGameExtractor:
     def _lookup_player(self, player_id: Optional[int]) -> str:
         if player_id is None:
             return "N/A"
-        result = _db_lookup_player(player_id=player_id)
-        if result:
-            first = result.get("player_first_name", "")
-            last = result.get("player_last_name", "")
-            return f"{first} {last}".strip() or "Unknown Player"
-        return "Unknown Player"
+        name = self._player_index.get(player_id)
+        if name is None:
+            name = "Unknown Player"
+            result = _db_lookup_player(player_id=player_id)
+            if result:
+                first = result.get("player_first_name", "")
+                last = result.get("player_last_name", "")
+                name = f"{first} {last}".strip() or name
+            self._player_index[player_id] = name
+        return name
 
     def _lookup_team(self, team_id: Optional[int]) -> str:
         if team_id is None:
             return "N/A Team"
-        result = _db_lookup_team(team_id=team_id)
-        if result:
-            city = result.get("city", "")
-            name = result.get("team_full_name", "")
-            return f"{city} {name}".strip() or "Unknown Team"
-        return "Unknown Team"
+        name = self._team_index.get(team_id)
+        if name is None:
+            name = "Unknown Team"
+            result = _db_lookup_team(team_id=team_id)
+            if result:
+                city = result.get("city", "")
+                team_name = result.get("team_full_name", "")
+                name = f"{city} {team_name}".strip() or name
+            self._team_index[team_id] = name
+        return name
 
     # ------------------------------------------------------------------
     # Data fetch
@@ -123,83 +242,119 @@ class NHLGameExtractor:
     def fetch_raw_data(self, game_pk: int) -> Optional[Dict[str, Any]]:
         """Fetch raw play-by-play data for a game_pk."""
         try:
+            # Only completed games reach here, so the default long TTL applies.
             url = f"https://api-web.nhle.com/v1/gamecenter/{game_pk}/play-by-play"
-            response = requests.get(url)
+            response = cached_get(url)
             response.raise_for_status()
-            return response.json()
+            logger.debug("Fetched NHL play-by-play for game %s", game_pk)
+            return read_json(response)
         except requests.exceptions.RequestException as e:
-            print(f"Error fetching NHL game data: {e}")
+            logger.warning("Error fetching NHL game data: %s", e)
             return None
 
     # ------------------------------------------------------------------
     # Play parsers
     # ------------------------------------------------------------------
 
-    def _parse_goal(self, details: Dict[str, Any]) -> str:
-        scoring_player = self._lookup_player(details.get("scoringPlayerId"))
-        team = self._lookup_team(details.get("eventOwnerTeamId"))
-        goalie = self._lookup_player(details.get("goalieInNetId"))
+    # Detail keys read by each parser, fetched in one map(details.get, ...)
+    # pass.  Any of them may be absent (empty-net goals, unassisted goals,
+    # penalties nobody drew), so a missing key must give None, not KeyError.
+    _GOAL_KEYS = ("scoringPlayerId", "eventOwnerTeamId", "goalieInNetId",
+                  "assist1PlayerId", "assist2PlayerId")
+    _HIT_KEYS = ("hittingPlayerId", "hitteePlayerId", "eventOwnerTeamId")
+    _PENALTY_KEYS = ("eventOwnerTeamId", "committedByPlayerId", "drawnByPlayerId")
+    _SHOT_KEYS = ("shootingPlayerId", "eventOwnerTeamId", "goalieInNetId")
+    _TAKEAWAY_KEYS = ("playerId", "eventOwnerTeamId")
+
+    def _parse_goal(self, details: Mapping[str, Any]) -> str:
+        scorer_id, team_id, goalie_id, *assist_ids = map(details.get, self._GOAL_KEYS)
+        scoring_player = self._lookup_player(scorer_id)
+        team = self._lookup_team(team_id)
+        goalie = self._lookup_player(goalie_id)
         goalie_text = f"on {goalie}" if goalie != "Unknown Player" else "into an empty net"
-        narrative = f"{scoring_player} ({team}) scored {goalie_text}"
-
-        assists = []
-        if details.get("assist1PlayerId"):
-            assists.append(self._lookup_player(details["assist1PlayerId"]))
-        if details.get("assist2PlayerId"):
-            assists.append(self._lookup_player(details["assist2PlayerId"]))
 
-        if len(assists) == 1:
-            narrative += f" assisted by {assists[0]}"
-        elif len(assists) == 2:
-            narrative += f" assisted by {assists[0]} and {assists[1]}"
+        assists = [self._lookup_player(assist_id) for assist_id in assist_ids if assist_id]
+        assist_text = f" assisted by {' and '.join(assists)}" if assists else ""
 
-        return narrative
+        return f"{scoring_player} ({team}) scored {goalie_text}{assist_text}"
 
-    def _parse_hit(self, details: Dict[str, Any]) -> str:
-        hitter = self._lookup_player(details.get("hittingPlayerId"))
-        hittee = self._lookup_player(details.get("hitteePlayerId"))
-        team = self._lookup_team(details.get("eventOwnerTeamId"))
+    def _parse_hit(self, details: Mapping[str, Any]) -> str:
+        hitter_id, hittee_id, team_id = map(details.get, self._HIT_KEYS)
+        hitter = self._lookup_player(hitter_id)
+        hittee = self._lookup_player(hittee_id)
+        team = self._lookup_team(team_id)
         return f"{hitter} ({team}) hit {hittee}"
 
-    def _parse_penalty(self, details: Dict[str, Any]) -> str:
+    def _parse_penalty(self, details: Mapping[str, Any]) -> str:
+        team_id, committed_by_id, drawn_by_id = map(details.get, self._PENALTY_KEYS)
         reason = details.get("descKey", "Unknown Reason")
         duration = f'{details.get("duration", 0)} {details.get("typeCode", "min")}'
-        team = self._lookup_team(details.get("eventOwnerTeamId"))
-        committed_by = self._lookup_player(details.get("committedByPlayerId"))
-        narrative = f"{duration} penalty for {committed_by} ({team}) for {reason}"
+        team = self._lookup_team(team_id)
+        committed_by = self._lookup_player(committed_by_id)
+        drawn_text = f" (drawn by {self._lookup_player(drawn_by_id)})" if drawn_by_id else ""
 
-        if drawn_by_id := details.get("drawnByPlayerId"):
-            narrative += f" (drawn by {self._lookup_player(drawn_by_id)})"
+        return f"{duration} penalty for {committed_by} ({team}) for {reason}{drawn_text}"
 
-        return narrative
-
-    def _parse_shot_on_goal(self, details: Dict[str, Any]) -> str:
-        shooter = self._lookup_player(details.get("shootingPlayerId"))
-        team = self._lookup_team(details.get("eventOwnerTeamId"))
-        goalie = self._lookup_player(details.get("goalieInNetId"))
+    def _parse_shot_on_goal(self, details: Mapping[str, Any]) -> str:
+        shooter_id, team_id, goalie_id = map(details.get, self._SHOT_KEYS)
+        shooter = self._lookup_player(shooter_id)
+        team = self._lookup_team(team_id)
+        goalie = self._lookup_player(goalie_id)
         return f"Shot on goal by {shooter} ({team}) saved by {goalie}"
 
-    def _parse_takeaway(self, details: Dict[str, Any]) -> str:
-        team = self._lookup_team(details.get("eventOwnerTeamId"))
-        player = self._lookup_player(details.get("playerId"))
+    def _parse_takeaway(self, details: Mapping[str, Any]) -> str:
+        player_id, team_id = map(details.get, self._TAKEAWAY_KEYS)
+        team = self._lookup_team(team_id)
+        player = self._lookup_player(player_id)
         return f"Takeaway by {player} ({team})"
 
-    def _build_narrative(self, play: Dict[str, Any]) -> str:
-        period = play.get("periodDescriptor", {}).get("number", "N/A")
-        time_remaining = play.get("timeRemaining", "0:00")
-        details = play.get("details", {})
-        play_type = play.get("typeDescKey")
-
-        parser_map = {
-            "goal": self._parse_goal,
-            "hit": self._parse_hit,
-            "penalty": self._parse_penalty,
-            "shot-on-goal": self._parse_shot_on_goal,
-            "takeaway": self._parse_takeaway,
+    # typeDescKey -> parser method name; also the set of play types rendered
+    # into the narrative.  Names rather than functions, so dispatch goes
+    # through getattr and picks up subclass overrides.
+    _PARSERS = {
+        "goal": "_parse_goal",
+        "hit": "_parse_hit",
+        "penalty": "_parse_penalty",
+        "shot-on-goal": "_parse_shot_on_goal",
+        "takeaway": "_parse_takeaway",
+    }
+    _NARRATIVE_TYPES = frozenset(_PARSERS)
+
+    def _prefetch_players(self, plays: List[Dict[str, Any]]) -> None:
+        """Resolve every player named in plays concurrently.
+
+        Cold lookups can fall through to the NHL API, so doing them up front
+        in a thread pool costs roughly one round trip instead of one per
+        unknown player while the narrative is built.
+        """
+        missing = {
+            player_id
+            for play in plays
+            if play.get("typeDescKey") in self._NARRATIVE_TYPES
+            for details in (play.get("details", _EMPTY),)
+            for key in self._PLAYER_ID_KEYS
+            if (player_id := details.get(key)) is not None
+            and player_id not in self._player_index
         }
+        if not missing:
+            return
+        logger.debug("Prefetching %d NHL players", len(missing))
+        try:
+            with ThreadPoolExecutor(max_workers=min(self._PREFETCH_WORKERS, len(missing))) as executor:
+                list(executor.map(self._lookup_player, missing))
+        except Exception:
+            # Best effort: anything left unresolved is looked up serially.
+            logger.warning("NHL player prefetch failed", exc_info=True)
 
-        parser = parser_map.get(play_type or '') or (lambda d: f"Unknown play type: {play_type}")
-        description = parser(details)
+    def _build_narrative(self, play: Dict[str, Any]) -> str:
+        get = play.get
+        period = get("periodDescriptor", _EMPTY).get("number", "N/A")
+        time_remaining = get("timeRemaining", "0:00")
+        details = get("details", _EMPTY)
+        play_type = get("typeDescKey")
+
+        parser = self._PARSERS.get(play_type or '')
+        description = getattr(self, parser)(details) if parser else f"Unknown play type: {play_type}"
         zone = details.get("zoneCode", "N/A")
         return f"[Period {period}, {time_remaining}] {description} in zone {zone}."
 
@@ -219,10 +374,17 @@ class NHLGameExtractor:
             home_name = home.get("placeName", {}).get("default", "Home") + " " + home.get("commonName", {}).get("default", "Team")
             away_name = away.get("placeName", {}).get("default", "Away") + " " + away.get("commonName", {}).get("default", "Team")
 
-            play_narratives: List[str] = [
-                self._build_narrative(play)
-                for play in raw_data.get("plays", [])
-                if play.get("typeDescKey") in {'goal', 'hit', 'penalty', 'shot-on-goal', 'takeaway'}
+            plays = raw_data.get("plays", [])
+            self._prefetch_players(plays)
+            # Bound once: the comprehension runs for every play in the game.
+            build = self._build_narrative
+            rank = self._TYPE_RANK.get
+            default_rank = self._DEFAULT_RANK
+            narrative_types = self._NARRATIVE_TYPES
+            play_narratives: List[Tuple[int, str]] = [
+                (rank(play_type, default_rank), build(play))
+                for play in plays
+                if (play_type := play.get("typeDescKey")) in narrative_types
             ]
 
             return {
@@ -230,10 +392,10 @@ class NHLGameExtractor:
                 'away_team': away_name,
                 'home_score': home.get("score", 0),
                 'away_score': away.get("score", 0),
-                'narrative_snippets': " ".join(play_narratives),
+                'narrative_snippets': _select_narrative(play_narratives),
             }
         except (KeyError, IndexError, TypeError) as e:
-            print(f"Error parsing NHL game data: {e}")
+            logger.warning("Error parsing NHL game data: %s", e)
             return "Could not parse NHL game details for summary generation."
 
 
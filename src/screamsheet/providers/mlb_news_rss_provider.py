@@ -1,11 +1,13 @@
 """MLB.com news data provider using team-specific RSS feeds."""
+import re
 import feedparser  # type: ignore[import-untyped]
-import requests
 from bs4 import BeautifulSoup
 from typing import Dict, List, Optional
 from datetime import datetime
 
 from ..base import DataProvider
+from ._feeds import conditional_headers, feed_entries
+from ._http import pooled_get
 
 
 class MLBNewsRssProvider(DataProvider):
@@ -46,6 +48,7 @@ class MLBNewsRssProvider(DataProvider):
         "Spring Breakout",
         "stream games",
     ]
+    _JUNK_RE = re.compile("|".join(map(re.escape, JUNK_KEYWORDS)), re.IGNORECASE)
 
     # CSS selectors tried in order when scraping MLB.com article pages.
     _ARTICLE_SELECTORS: List[str] = [
@@ -60,7 +63,9 @@ class MLBNewsRssProvider(DataProvider):
     _SCRAPE_HEADERS: Dict[str, str] = {
         "User-Agent": (
             "Mozilla/5.0 (compatible; screamsheet/1.0; +https://github.com/peterjmartinson/screamsheet)"
-        )
+        ),
+        # Overrides the JSON Accept header of the shared provider session.
+        "Accept": "text/html,application/xhtml+xml,*/*;q=0.8",
     }
 
     def __init__(
@@ -72,6 +77,8 @@ class MLBNewsRssProvider(DataProvider):
         super().__init__(**config)
         self.favorite_teams: List[str] = favorite_teams or []
         self.max_articles: int = max_articles
+        self._feed_cache: Dict[str, List[object]] = {}
+        self._scrape_cache: Dict[str, str] = {}
 
     # ------------------------------------------------------------------
     # DataProvider interface stubs (not applicable for a news provider)
@@ -172,10 +179,20 @@ class MLBNewsRssProvider(DataProvider):
     def _is_junk_article(self, entry: object) -> bool:
         """Return True if the entry title contains any junk keyword."""
         title: str = entry.get("title", "") if hasattr(entry, "get") else ""  # type: ignore[union-attr]
-        title_lower = title.lower()
-        return any(kw.lower() in title_lower for kw in self.JUNK_KEYWORDS)
+        return self._JUNK_RE.search(title) is not None
 
     def _scrape_article_text(self, url: str) -> str:
+        """
+        Return the article body text for ``url``, scraping it on first use.
+
+        Both news sections of a sheet sanitize the same article list, so
+        the text is cached per URL to fetch each article page only once.
+        """
+        if url not in self._scrape_cache:
+            self._scrape_cache[url] = self._download_article_text(url)
+        return self._scrape_cache[url]
+
+    def _download_article_text(self, url: str) -> str:
         """
         Fetch ``url`` and extract article body paragraphs.
 
@@ -184,7 +201,7 @@ class MLBNewsRssProvider(DataProvider):
         Returns an empty string on any network or parse failure.
         """
         try:
-            resp = requests.get(url, timeout=self._SCRAPE_TIMEOUT, headers=self._SCRAPE_HEADERS)
+            resp = pooled_get(url, timeout=self._SCRAPE_TIMEOUT, headers=self._SCRAPE_HEADERS)
             if resp.status_code != 200:
                 return ""
             soup = BeautifulSoup(resp.text, "html.parser")
@@ -208,10 +225,12 @@ class MLBNewsRssProvider(DataProvider):
         return None
 
     def _fetch_entries(self, team: Optional[str]) -> List[object]:
-        """Fetch and return raw feedparser entries for the given team (or general feed)."""
+        """Fetch and cache raw feedparser entries for the given team (or general feed)."""
         url = self.TEAM_FEEDS.get(team)
         if url is None:
             return []
-        feed = feedparser.parse(url)
-        return list(feed.entries)
+        if url not in self._feed_cache:
+            feed = feedparser.parse(url, **conditional_headers(url))
+            self._feed_cache[url] = list(feed_entries(url, feed))
+        return self._feed_cache[url]
 
@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 from typing import Any, Optional, List, Dict, Tuple
 
 from ..base import DataProvider
+from ._http import cached_get, expire_after_for, pooled_get, read_json
 
 
 class MLBDataProvider(DataProvider):
@@ -18,9 +19,24 @@ class MLBDataProvider(DataProvider):
     - Game summaries (via LLM)
     """
     
+    # StatsAPI `fields` filter: only the keys _get_game_pk reads are returned,
+    # which cuts the schedule payload to a fraction of its full size.
+    GAME_PK_FIELDS = (
+        'dates,games,gamePk,status,abstractGameCode,detailedState,'
+        'teams,away,home,team,id'
+    )
+    
     def __init__(self, **config):
         super().__init__(**config)
         self.base_url = "https://statsapi.mlb.com"
+        # Parsed box scores keyed by (team_id, YYYY-MM-DD); failed lookups
+        # (None) are not stored so they can be retried.
+        self._box_score_cache: Dict[Tuple[int, str], Dict[str, List[Dict[str, Any]]]] = {}
+        # has_game(), get_box_score() and get_game_summary() all resolve the
+        # same (team_id, date) -> gamePk; remember it so the schedule is
+        # looked up once per team/date instead of once per caller.  Request
+        # errors propagate and are not stored.
+        self._game_pk_cache: Dict[Tuple[int, str], Optional[int]] = {}
     
     def get_game_scores(self, date: datetime) -> list:
         """
@@ -41,9 +57,9 @@ class MLBDataProvider(DataProvider):
             f"&endDate={game_date}"
         )
         
-        response = requests.get(url)
+        response = pooled_get(url)
         response.raise_for_status()
-        data = response.json()
+        data = read_json(response)
         
         games = []
         for date_data in data.get("dates", []):
@@ -75,9 +91,9 @@ class MLBDataProvider(DataProvider):
             season = datetime.now().year
 
         url = f"{self.base_url}/api/v1/standings?season={season}&leagueId=103,104"
-        response = requests.get(url)
+        response = pooled_get(url)
         response.raise_for_status()
-        data = response.json()
+        data = read_json(response)
         
         team_list = []
         for record in data.get("records", []):
@@ -116,9 +132,9 @@ class MLBDataProvider(DataProvider):
             url = self.base_url + record.get("division", {}).get("link", "")
             if not url or url == self.base_url:
                 return "Unknown Division"
-            response = requests.get(url)
+            response = pooled_get(url)
             response.raise_for_status()
-            data = response.json()
+            data = read_json(response)
             return data.get("divisions", [{}])[0].get("name", "Unknown Division")
         except Exception as e:
             print(f"Warning: Error getting division name: {e}")
@@ -126,12 +142,25 @@ class MLBDataProvider(DataProvider):
     
     def _get_game_pk(self, team_id: int, date: datetime) -> Optional[int]:
         """Return the gamePk for a completed game on date, or None."""
+        key = (team_id, date.strftime("%Y-%m-%d"))
+        if key not in self._game_pk_cache:
+            self._game_pk_cache[key] = self._fetch_game_pk(team_id, date)
+        return self._game_pk_cache[key]
+
+    def _fetch_game_pk(self, team_id: int, date: datetime) -> Optional[int]:
+        """Scan the schedule for date and return team_id's completed gamePk."""
         game_date = date.strftime("%Y-%m-%d")
         schedule_url = f"{self.base_url}/api/v1/schedule"
-        params = {'sportId': 1, 'teamId': team_id, 'date': game_date}
-        schedule_response = requests.get(schedule_url, params=params)
+        params = {
+            'sportId': 1,
+            'teamId': team_id,
+            'date': game_date,
+            'fields': self.GAME_PK_FIELDS,
+        }
+        schedule_response = cached_get(schedule_url, params=params,
+                                       expire_after=expire_after_for(date))
         schedule_response.raise_for_status()
-        schedule_data = schedule_response.json()
+        schedule_data = read_json(schedule_response)
 
         if 'dates' in schedule_data and schedule_data['dates']:
             for game in schedule_data['dates'][0]['games']:
@@ -148,9 +177,9 @@ class MLBDataProvider(DataProvider):
         schedule_url = f"{self.base_url}/api/v1/schedule"
         params = {'sportId': 1, 'gameType': game_type, 'date': game_date}
         try:
-            schedule_response = requests.get(schedule_url, params=params)
+            schedule_response = pooled_get(schedule_url, params=params)
             schedule_response.raise_for_status()
-            schedule_data = schedule_response.json()
+            schedule_data = read_json(schedule_response)
             if 'dates' in schedule_data and schedule_data['dates']:
                 for game in schedule_data['dates'][0]['games']:
                     status = game.get('status', {})
@@ -177,9 +206,9 @@ class MLBDataProvider(DataProvider):
             f"&endDate={game_date}"
         )
         try:
-            response = requests.get(url)
+            response = pooled_get(url)
             response.raise_for_status()
-            data = response.json()
+            data = read_json(response)
         except requests.exceptions.RequestException as e:
             print(f"Error fetching MLB schedule for fallback: {e}")
             return []
@@ -206,6 +235,19 @@ class MLBDataProvider(DataProvider):
         Returns:
             Box score data or None if not available
         """
+        key = (team_id, date.strftime("%Y-%m-%d"))
+        if key in self._box_score_cache:
+            return self._box_score_cache[key]
+
+        box_score = self._fetch_box_score(team_id, date)
+        if box_score is not None:
+            self._box_score_cache[key] = box_score
+        return box_score
+
+    def _fetch_box_score(
+        self, team_id: int, date: datetime
+    ) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """Fetch and parse the box score for team_id's completed game on date."""
         try:
             game_date = date.strftime("%Y-%m-%d")
 
@@ -217,44 +259,50 @@ class MLBDataProvider(DataProvider):
 
             # Fetch the detailed box score
             boxscore_url = f"{self.base_url}/api/v1/game/{game_pk}/boxscore"
-            boxscore_response = requests.get(boxscore_url)
+            boxscore_response = cached_get(boxscore_url)
             boxscore_response.raise_for_status()
-            boxscore_data = boxscore_response.json()
+            boxscore_data = read_json(boxscore_response)
 
             if not boxscore_data:
                 return {'batting_stats': [], 'pitching_stats': []}
 
             # Parse batting and pitching stats for the target team
-            home_team_id = boxscore_data['teams']['home']['team']['id']
-            target_team = 'home' if home_team_id == team_id else 'away'
-            players = boxscore_data['teams'][target_team]['players']
+            teams = boxscore_data['teams']
+            target_team = 'home' if teams['home']['team']['id'] == team_id else 'away'
+            players = teams[target_team]['players']
 
             batting_stats = []
             pitching_stats = []
 
+            # Single pass over the roster: each player's stats dict is looked
+            # up once and feeds whichever of the two tables it belongs to.
             for player_data in players.values():
-                if player_data['stats'].get('batting'):
-                    stats = player_data['stats']['batting']
+                stats = player_data['stats']
+                batting = stats.get('batting')
+                pitching = stats.get('pitching')
+                if not (batting or pitching):
+                    continue
+                name = player_data['person']['fullName']
+                if batting:
                     batting_stats.append({
-                        'name': player_data['person']['fullName'],
-                        'AB': stats.get('atBats', 0),
-                        'R': stats.get('runs', 0),
-                        'H': stats.get('hits', 0),
-                        'HR': stats.get('homeRuns', 0),
-                        'RBI': stats.get('rbi', 0),
-                        'BB': stats.get('baseOnBalls', 0),
-                        'SO': stats.get('strikeOuts', 0),
+                        'name': name,
+                        'AB': batting.get('atBats', 0),
+                        'R': batting.get('runs', 0),
+                        'H': batting.get('hits', 0),
+                        'HR': batting.get('homeRuns', 0),
+                        'RBI': batting.get('rbi', 0),
+                        'BB': batting.get('baseOnBalls', 0),
+                        'SO': batting.get('strikeOuts', 0),
                     })
-                if player_data['stats'].get('pitching'):
-                    stats = player_data['stats']['pitching']
+                if pitching:
                     pitching_stats.append({
-                        'name': player_data['person']['fullName'],
-                        'IP': stats.get('inningsPitched', '0.0'),
-                        'H': stats.get('hits', 0),
-                        'R': stats.get('runs', 0),
-                        'ER': stats.get('earnedRuns', 0),
-                        'BB': stats.get('baseOnBalls', 0),
-                        'SO': stats.get('strikeOuts', 0),
+                        'name': name,
+                        'IP': pitching.get('inningsPitched', '0.0'),
+                        'H': pitching.get('hits', 0),
+                        'R': pitching.get('runs', 0),
+                        'ER': pitching.get('earnedRuns', 0),
+                        'BB': pitching.get('baseOnBalls', 0),
+                        'SO': pitching.get('strikeOuts', 0),
                     })
 
             return {'batting_stats': batting_stats, 'pitching_stats': pitching_stats}
@@ -284,7 +332,11 @@ class MLBDataProvider(DataProvider):
             from ..llm.summary import MLBGameSummarizer, MLBFanRantSummarizer
             date_str = date.strftime("%Y-%m-%d")
             extractor = MLBGameExtractor()
-            raw = extractor.fetch_raw_data(team_id, date_str)
+            # The box score has usually resolved this game already (and the
+            # schedule response is cached), so hand the extractor the gamePk
+            # rather than have it repeat the schedule lookup.
+            game_pk = self._get_game_pk(team_id, date)
+            raw = extractor.fetch_raw_data(team_id, date_str, game_pk=game_pk)
             extracted = extractor.extract_key_info(raw)
             if isinstance(extracted, str):
                 return extracted
@@ -335,9 +387,9 @@ class MLBDataProvider(DataProvider):
             f"&endDate={game_date}"
         )
         try:
-            response = requests.get(url)
+            response = pooled_get(url)
             response.raise_for_status()
-            data = response.json()
+            data = read_json(response)
         except Exception as e:
             print(f"Error fetching All-Star schedule: {e}")
             return []
@@ -371,9 +423,9 @@ class MLBDataProvider(DataProvider):
 
         try:
             boxscore_url = f"{self.base_url}/api/v1/game/{game_pk}/boxscore"
-            boxscore_response = requests.get(boxscore_url)
+            boxscore_response = pooled_get(boxscore_url)
             boxscore_response.raise_for_status()
-            boxscore_data = boxscore_response.json()
+            boxscore_data = read_json(boxscore_response)
             if not boxscore_data:
                 return None
 
@@ -466,10 +518,10 @@ class MLBDataProvider(DataProvider):
 
         def _check_url(url: str) -> Optional[int]:
             try:
-                response = requests.get(url, headers=headers, timeout=10)
+                response = pooled_get(url, headers=headers, timeout=10)
                 if response.status_code != 200:
                     return None
-                data = response.json()
+                data = read_json(response)
                 for date_data in data.get("dates", []):
                     for event in date_data.get("events", []):
                         name = event.get("name", "")
@@ -524,11 +576,11 @@ class MLBDataProvider(DataProvider):
         url = f"{self.base_url}/api/v1/homeRunDerby/{game_pk}/bracket"
         headers = {"User-Agent": "Mozilla/5.0"}
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = pooled_get(url, headers=headers, timeout=10)
             if response.status_code == 404:
                 return None
             response.raise_for_status()
-            data = response.json()
+            data = read_json(response)
             
             rounds_summary = []
             champion = None
@@ -660,11 +712,11 @@ class MLBDataProvider(DataProvider):
         url = f"{self.base_url}/api/v1/homeRunDerby/{game_pk}/pool"
         headers = {"User-Agent": "Mozilla/5.0"}
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = pooled_get(url, headers=headers, timeout=10)
             if response.status_code == 404:
                 return None
             response.raise_for_status()
-            data = response.json()
+            data = read_json(response)
             
             longest_dist = 0
             longest_player = "N/A"
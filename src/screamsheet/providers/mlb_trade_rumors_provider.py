@@ -1,9 +1,11 @@
 """MLB Trade Rumors data provider for fetching news articles."""
+import re
 import feedparser
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
 from ..base import DataProvider
+from ._feeds import conditional_headers, feed_entries
 
 
 class MLBTradeRumorsProvider(DataProvider):
@@ -13,6 +15,9 @@ class MLBTradeRumorsProvider(DataProvider):
     Provides access to:
     - News articles from MLB Trade Rumors
     - Filtered and prioritized by favorite teams
+    
+    Results are cached after the first call so two ``NewsArticlesSection``
+    instances sharing the same provider only fetch the feed once.
     """
     
     RSS_URL = 'https://feeds.feedburner.com/MlbTradeRumors'
@@ -21,12 +26,19 @@ class MLBTradeRumorsProvider(DataProvider):
         'Presents Our', 'Podcast', 'Live Chat', 'Q&A', 'Ask Us Anything',
         'Best of', 'MLBTR Chat', 'Front Office'
     ]
+    # All keywords as one case-insensitive pattern: a single scan per field
+    _EXCLUSION_RE = re.compile('|'.join(map(re.escape, EXCLUSION_KEYWORDS)), re.IGNORECASE)
     
     def __init__(self, favorite_teams: Optional[List[str]] = None, max_articles: int = 4, **config):
         super().__init__(**config)
         self.favorite_teams = favorite_teams if favorite_teams is not None else []
         self.max_articles = max_articles
         self.team_priority = {team: i for i, team in enumerate(self.favorite_teams)}
+        # (priority, lowercased team) in priority order, fixed for the instance
+        self._prioritized_teams: Tuple[Tuple[int, str], ...] = tuple(
+            sorted((priority, team.lower()) for team, priority in self.team_priority.items())
+        )
+        self._cache: Optional[List[Dict]] = None
     
     def get_game_scores(self, date: datetime) -> list:
         """Not applicable for news provider."""
@@ -43,53 +55,59 @@ class MLBTradeRumorsProvider(DataProvider):
         Returns:
             List of article dictionaries with 'slot' and 'entry' keys
         """
-        feed = feedparser.parse(self.RSS_URL)
+        if self._cache is not None:
+            return self._cache
+        
+        feed = feedparser.parse(self.RSS_URL, **conditional_headers(self.RSS_URL))
         
-        # Filter out garbage articles
-        clean_entries = [
-            entry for entry in feed.entries
-            if not self._is_garbage(entry)
-        ]
+        # Favorite team (lowercased) -> reserved slot (priority-based, slot 0
+        # stays general)
+        team_slots = {
+            team: priority + 1
+            for priority, team in self._prioritized_teams
+            if priority + 1 < self.max_articles
+        }
+        general_needed = self.max_articles - len(team_slots)
         
-        # Prioritize and select articles
         final_selection = [None] * self.max_articles
         selected_guids = set()
+        general_entries = []
+        open_team_slots = len(team_slots)
         
-        # Fill team slots (priority-based)
-        for priority in sorted(self.team_priority.values()):
-            if priority + 1 >= self.max_articles:
-                break
-                
-            team_name = self.favorite_teams[priority]
-            slot_index = priority + 1
+        # Single pass: drop garbage, give each entry to the first unfilled
+        # favorite team named in its title (any case), otherwise keep it as
+        # general
+        for entry in feed_entries(self.RSS_URL, feed):
+            if self._is_garbage(entry):
+                continue
+            title = entry.get('title', '').lower()
+            guid = entry.get('link', '')
+            if guid in selected_guids:
+                continue
             
-            for entry in clean_entries:
-                title = entry.get('title', '')
-                guid = entry.get('link', '')
-                
-                if guid not in selected_guids and team_name in title:
+            for team_name, slot_index in team_slots.items():
+                if final_selection[slot_index] is None and team_name in title:
                     final_selection[slot_index] = entry
                     selected_guids.add(guid)
+                    open_team_slots -= 1
                     break
+            else:
+                general_entries.append(entry)
+            
+            if not open_team_slots and len(general_entries) >= general_needed:
+                break
         
         # Fill remaining slots with general articles
-        remaining_entries = [
-            entry for entry in clean_entries
+        remaining_entries = (
+            entry for entry in general_entries
             if entry.get('link', '') not in selected_guids
-        ]
-        
-        fill_index = 0
-        entry_index = 0
-        
-        while fill_index < self.max_articles and entry_index < len(remaining_entries):
-            if final_selection[fill_index] is None:
-                entry = remaining_entries[entry_index]
+        )
+        for fill_index, slot_entry in enumerate(final_selection):
+            if slot_entry is None:
+                entry = next(remaining_entries, None)
+                if entry is None:
+                    break
                 final_selection[fill_index] = entry
-                selected_guids.add(entry.get('link', ''))
-                entry_index += 1
-                fill_index += 1
-            else:
-                fill_index += 1
         
         # Format output
         output_list = []
@@ -100,14 +118,10 @@ class MLBTradeRumorsProvider(DataProvider):
                     'entry': entry
                 })
         
+        self._cache = output_list
         return output_list
     
     def _is_garbage(self, entry: Dict) -> bool:
         """Check if an article contains blacklisted promotional keywords."""
-        title = entry.get('title', '').lower()
-        summary = entry.get('summary', '').lower()
-        
-        for keyword in self.EXCLUSION_KEYWORDS:
-            if keyword.lower() in title or keyword.lower() in summary:
-                return True
-        return False
+        search = self._EXCLUSION_RE.search
+        return bool(search(entry.get('title', '')) or search(entry.get('summary', '')))
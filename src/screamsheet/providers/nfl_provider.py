@@ -6,6 +6,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Optional, List, Dict
 
 from ..base import DataProvider
+from ._http import pooled_get, read_json
 
 
 class NFLDataProvider(DataProvider):
@@ -70,9 +71,9 @@ class NFLDataProvider(DataProvider):
             url = f"{base_standings_url}{group_id}/standings/0"
             
             try:
-                response = requests.get(url)
+                response = pooled_get(url)
                 response.raise_for_status()
-                data = response.json()
+                data = read_json(response)
             except requests.exceptions.RequestException as e:
                 print(f"Error fetching standings for {conference_name}: {e}")
                 continue
@@ -124,9 +125,9 @@ class NFLDataProvider(DataProvider):
             for group_id, conference_name in conferences.items():
                 url = f"{prev_base_url}{group_id}/standings/0"
                 try:
-                    response = requests.get(url)
+                    response = pooled_get(url)
                     response.raise_for_status()
-                    data = response.json()
+                    data = read_json(response)
                 except requests.exceptions.RequestException as e:
                     print(f"Error fetching standings for {conference_name} (season {prev_season}): {e}")
                     continue
@@ -173,9 +174,9 @@ class NFLDataProvider(DataProvider):
         team_name_lookup = {}
         
         try:
-            response = requests.get(teams_url)
+            response = pooled_get(teams_url)
             response.raise_for_status()
-            data = response.json()
+            data = read_json(response)
             
             teams_list = data.get("sports", [])[0].get("leagues", [])[0].get("teams", [])
             for team_entry in teams_list:
@@ -223,9 +224,9 @@ class NFLDataProvider(DataProvider):
         }
         
         try:
-            response = requests.get(url)
+            response = pooled_get(url)
             response.raise_for_status()
-            data = response.json()
+            data = read_json(response)
         except requests.exceptions.RequestException as e:
             print(f"Error fetching scoreboard data: {e}")
             return None
@@ -273,9 +274,9 @@ class NFLDataProvider(DataProvider):
         )
         
         try:
-            response = requests.get(url)
+            response = pooled_get(url)
             response.raise_for_status()
-            data = response.json()
+            data = read_json(response)
         except requests.exceptions.RequestException as e:
             print(f"Error fetching data from ESPN API: {e}")
             return []
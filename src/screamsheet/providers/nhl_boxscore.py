@@ -2,16 +2,34 @@
 
 Migrated from src/get_box_score_nhl.py during modularisation cleanup.
 """
+import logging
 import requests
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List, Union
 from dataclasses import dataclass
+from itertools import chain
 
 from reportlab.platypus import Table, TableStyle
 from reportlab.lib import colors
 
+from ._http import cached_get, read_json
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+# Built once at import; setStyle() copies the commands into each Table.
+_SKATER_HEADER = ("Skater", "G", "A", "P", "SOG", "PIM")
+_GOALIE_HEADER = ("Goaltender", "SA", "SV", "SV%")
+_BOX_TABLE_STYLE = TableStyle([
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+
+
+@dataclass(slots=True, frozen=True)
 class PlayerSkater:
     name: str
     goals: int
@@ -21,7 +39,7 @@ class PlayerSkater:
     pim: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PlayerGoalie:
     name: str
     shots_against: int
@@ -33,11 +51,12 @@ def get_game_boxscore(game_pk: int) -> Optional[Dict[str, Any]]:
     """Fetch box score data for a completed NHL game."""
     try:
         boxscore_url = f"https://api-web.nhle.com/v1/gamecenter/{game_pk}/boxscore"
-        response = requests.get(boxscore_url)
+        logger.debug("NHL boxscore url=%s", boxscore_url)
+        response = cached_get(boxscore_url)
         response.raise_for_status()
-        return response.json()
+        return read_json(response)
     except requests.exceptions.RequestException as e:
-        print(f"Error fetching NHL box score data: {e}")
+        logger.warning("Error fetching NHL box score for game %s: %s", game_pk, e)
         return None
 
 
@@ -52,30 +71,26 @@ def parse_nhl_boxscore(
         "homeTeam" if boxscore_data['homeTeam']['id'] == team_id else "awayTeam"
     )
 
-    raw_skaters = (
-        boxscore_data['playerByGameStats'][target_team_code]['forwards']
-        + boxscore_data['playerByGameStats'][target_team_code]['defense']
-    )
+    team_stats = boxscore_data['playerByGameStats'][target_team_code]
 
-    skater_stats: List[PlayerSkater] = []
-    for player in raw_skaters:
-        skater_stats.append(PlayerSkater(
+    skater_stats: List[PlayerSkater] = [
+        PlayerSkater(
             name=player['name']['default'],
             goals=player.get('goals', 0),
             assists=player.get('assists', 0),
             points=player.get('points', 0),
             shots_on_goal=player.get('shots', 0),
             pim=player.get('pim', 0),
-        ))
+        )
+        for player in chain(team_stats['forwards'], team_stats['defense'])
+    ]
 
     goalie_stats: List[PlayerGoalie] = []
-    raw_goalies = boxscore_data['playerByGameStats'][target_team_code]['goalies']
-    for player in raw_goalies:
+    for player in team_stats['goalies']:
         shots_against = player.get('shotsAgainst', 0)
         saves = player.get('saves', 0)
-        sv_pct: Optional[float] = (
-            saves / shots_against if shots_against and shots_against > 0 else None
-        )
+        # A falsy count (0 or a null from the API) means no shots faced.
+        sv_pct: Optional[float] = saves / shots_against if shots_against else None
         goalie_stats.append(PlayerGoalie(
             name=player['name']['default'],
             shots_against=shots_against,
@@ -93,7 +108,7 @@ def create_nhl_boxscore_tables(
     skater_stats: List[PlayerSkater] = boxscore_stats['skater_stats']
     goalie_stats: List[PlayerGoalie] = boxscore_stats['goalie_stats']
 
-    skater_data = [["Skater", "G", "A", "P", "SOG", "PIM"]]
+    skater_data: List[List[Any]] = [list(_SKATER_HEADER)]
     for player in skater_stats:
         skater_data.append([
             player.name, player.goals, player.assists,
@@ -101,30 +116,18 @@ def create_nhl_boxscore_tables(
         ])
 
     skater_table = Table(skater_data)
-    skater_table.setStyle(TableStyle([
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
-
-    goalie_data = [["Goaltender", "SA", "SV", "SV%"]]
+    skater_table.setStyle(_BOX_TABLE_STYLE)
+
+    goalie_data: List[List[Any]] = [list(_GOALIE_HEADER)]
     for player in goalie_stats:
+        sv_pct = player.save_percentage
+        sv_pct_str = f"{sv_pct:.3f}" if sv_pct is not None else 'N/A'
         goalie_data.append([
-            player.name, player.shots_against, player.saves, player.save_percentage,
+            player.name, player.shots_against, player.saves, sv_pct_str,
         ])
 
     goalie_table = Table(goalie_data)
-    goalie_table.setStyle(TableStyle([
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
+    goalie_table.setStyle(_BOX_TABLE_STYLE)
 
     return {'skater_table': skater_table, 'goalie_table': goalie_table}
 
@@ -1,11 +1,12 @@
 """NHL.com news data provider using team-specific news pages."""
-import requests
+import re
 from bs4 import BeautifulSoup
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta, timezone
 from urllib.parse import urljoin
 
 from ..base import DataProvider
+from ._http import pooled_get
 
 
 class NHLNewsRssProvider(DataProvider):
@@ -68,6 +69,7 @@ class NHLNewsRssProvider(DataProvider):
         "stream games",
         "fantasy",
     ]
+    _JUNK_RE = re.compile("|".join(map(re.escape, JUNK_KEYWORDS)), re.IGNORECASE)
 
     # CSS selectors tried in order when scraping NHL.com article pages.
     _ARTICLE_SELECTORS: List[str] = [
@@ -84,7 +86,9 @@ class NHLNewsRssProvider(DataProvider):
     _SCRAPE_HEADERS: Dict[str, str] = {
         "User-Agent": (
             "Mozilla/5.0 (compatible; screamsheet/1.0; +https://github.com/peterjmartinson/screamsheet)"
-        )
+        ),
+        # Overrides the JSON Accept header of the shared provider session.
+        "Accept": "text/html,application/xhtml+xml,*/*;q=0.8",
     }
 
     def __init__(
@@ -97,6 +101,7 @@ class NHLNewsRssProvider(DataProvider):
         self.favorite_teams: List[str] = favorite_teams or []
         self.max_articles: int = max_articles
         self._article_cache: Dict[Optional[str], List[Dict]] = {}
+        self._scrape_cache: Dict[str, str] = {}
 
     # ------------------------------------------------------------------
     # DataProvider interface stubs (not applicable for a news provider)
@@ -196,8 +201,7 @@ class NHLNewsRssProvider(DataProvider):
     def _is_junk_article(self, entry: object) -> bool:
         """Return True if the entry title contains any junk keyword."""
         title: str = entry.get("title", "") if hasattr(entry, "get") else ""  # type: ignore[union-attr]
-        title_lower = title.lower()
-        return any(kw.lower() in title_lower for kw in self.JUNK_KEYWORDS)
+        return self._JUNK_RE.search(title) is not None
 
     def _team_matches_entry(self, team: str, entry: object) -> bool:
         """Return True when ``entry`` looks like it belongs to ``team``."""
@@ -278,7 +282,7 @@ class NHLNewsRssProvider(DataProvider):
             return self._article_cache[url]
 
         try:
-            resp = requests.get(url, timeout=self._SCRAPE_TIMEOUT, headers=self._SCRAPE_HEADERS)
+            resp = pooled_get(url, timeout=self._SCRAPE_TIMEOUT, headers=self._SCRAPE_HEADERS)
             if resp.status_code != 200:
                 self._article_cache[url] = []
                 return []
@@ -290,6 +294,17 @@ class NHLNewsRssProvider(DataProvider):
         return entries
 
     def _scrape_article_text(self, url: str) -> str:
+        """
+        Return the article body text for ``url``, scraping it on first use.
+
+        Both news sections of a sheet sanitize the same article list, so
+        the text is cached per URL to fetch each article page only once.
+        """
+        if url not in self._scrape_cache:
+            self._scrape_cache[url] = self._download_article_text(url)
+        return self._scrape_cache[url]
+
+    def _download_article_text(self, url: str) -> str:
         """
         Fetch ``url`` and extract article body paragraphs.
 
@@ -298,7 +313,7 @@ class NHLNewsRssProvider(DataProvider):
         Returns an empty string on any network or parse failure.
         """
         try:
-            resp = requests.get(url, timeout=self._SCRAPE_TIMEOUT, headers=self._SCRAPE_HEADERS)
+            resp = pooled_get(url, timeout=self._SCRAPE_TIMEOUT, headers=self._SCRAPE_HEADERS)
             if resp.status_code != 200:
                 return ""
             soup = BeautifulSoup(resp.text, "html.parser")
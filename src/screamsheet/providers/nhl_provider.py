@@ -1,5 +1,6 @@
 """NHL data provider for fetching NHL game data."""
 import json
+import logging
 import requests
 import pandas as pd
 from datetime import datetime, timedelta
@@ -7,6 +8,9 @@ from pathlib import Path
 from typing import Any, Optional, List, Dict, Tuple
 
 from ..base import DataProvider
+from ._http import cached_get, expire_after_for, pooled_get, read_json
+
+logger = logging.getLogger(__name__)
 
 
 class NHLDataProvider(DataProvider):
@@ -26,6 +30,10 @@ class NHLDataProvider(DataProvider):
         super().__init__(**config)
         self.base_url = "https://api-web.nhle.com/v1"
         self.dump = config.get('dump', False)
+        # has_game(), get_box_score() and get_game_summary() all resolve the
+        # same (team_id, date) -> game PK; remember it so the schedule is
+        # fetched once per team/date instead of once per caller.
+        self._game_pk_cache: Dict[Tuple[int, str], Optional[int]] = {}
 
     def _dump_json(self, response, output_filename: str) -> None:
         """Write a requests Response JSON body to a timestamped file in logfiles/."""
@@ -34,8 +42,8 @@ class NHLDataProvider(DataProvider):
         filedate = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         filepath = output_dir / f"{output_filename}_{filedate}.json"
         with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(response.json(), f, indent=4)
-        print(f"{filepath} written")
+            json.dump(read_json(response), f, indent=4)
+        logger.info("%s written", filepath)
 
     def get_game_scores(self, date: datetime) -> List[Dict]:
         """
@@ -50,9 +58,9 @@ class NHLDataProvider(DataProvider):
         game_date = date.strftime("%Y-%m-%d")
         url = f"{self.base_url}/schedule/{game_date}"
         
-        response = requests.get(url)
+        response = pooled_get(url)
         response.raise_for_status()
-        data = response.json()
+        data = read_json(response)
         
         if self.dump:
             self._dump_json(response, "nhl_game_scores")
@@ -121,9 +129,9 @@ class NHLDataProvider(DataProvider):
         """
         url = f"{self.base_url}/standings/now"
         
-        response = requests.get(url)
+        response = pooled_get(url)
         response.raise_for_status()
-        data = response.json()
+        data = read_json(response)
         
         if self.dump:
             self._dump_json(response, "nhl_standings")
@@ -176,8 +184,8 @@ class NHLDataProvider(DataProvider):
             if game_pk:
                 return get_nhl_boxscore(team_id, game_pk)
             return None
-        except Exception as e:
-            print(f"Error getting NHL box score: {e}")
+        except Exception:
+            logger.exception("Error getting NHL box score for team_id=%s", team_id)
             return None
     
     def get_game_summary(self, team_id: int, date: datetime, is_primary_favorite: bool = False) -> Optional[str]:
@@ -236,8 +244,8 @@ class NHLDataProvider(DataProvider):
                 data = extracted  # type: ignore[assignment]
 
             return summarizer.generate_summary(llm_choice="gemini", data=data)
-        except Exception as e:
-            print(f"Error getting NHL game summary: {e}")
+        except Exception:
+            logger.exception("Error getting NHL game summary for team_id=%s", team_id)
             return None
     
     def has_game(self, team_id: int, date: datetime) -> bool:
@@ -249,11 +257,11 @@ class NHLDataProvider(DataProvider):
         game_date = date.strftime("%Y-%m-%d")
         url = f"{self.base_url}/schedule/{game_date}"
         try:
-            response = requests.get(url)
+            response = pooled_get(url)
             response.raise_for_status()
-            data = response.json()
+            data = read_json(response)
         except requests.exceptions.RequestException as e:
-            print(f"Error fetching NHL schedule for fallback: {e}")
+            logger.warning("Error fetching NHL schedule for fallback: %s", e)
             return []
 
         teams: List[Tuple[int, str]] = []
@@ -276,6 +284,9 @@ class NHLDataProvider(DataProvider):
     def _get_game_pk(self, team_id: int, date: datetime) -> Optional[int]:
         """
         Get the game PK for a specific team and date.
+
+        Successful lookups (including "no game") are memoised per instance;
+        request errors are not, so a later caller can retry.
         
         Args:
             team_id: The NHL team ID
@@ -285,34 +296,41 @@ class NHLDataProvider(DataProvider):
             Game PK or None if not found
         """
         game_date_str = date.strftime('%Y-%m-%d')
-        schedule_url = f"{self.base_url}/schedule/{game_date_str}"
-        
+        key = (team_id, game_date_str)
+        if key in self._game_pk_cache:
+            return self._game_pk_cache[key]
+
         try:
-            schedule_response = requests.get(schedule_url)
-            schedule_response.raise_for_status()
-            schedule_data = schedule_response.json()
-            
-            if self.dump:
-                self._dump_json(schedule_response, "nhl_get_game_pk")
-            
-            game_pk = None
-            
-            if 'gameWeek' in schedule_data and schedule_data['gameWeek']:
-                for day in schedule_data['gameWeek']:
-                    for game in day.get('games', []):
-                        if str(game['gameState']) == self.FINAL_STATUS_CODE:
-                            home_id = game['homeTeam']['id']
-                            away_id = game['awayTeam']['id']
-                            
-                            if home_id == team_id or away_id == team_id:
-                                game_pk = game['id']
-                                break
-                    if game_pk:
-                        return game_pk
-            
-            if not game_pk:
-                print(f"No completed game found for team ID {team_id} on {game_date_str}.")
-            return None
+            game_pk = self._fetch_game_pk(team_id, date)
         except requests.exceptions.RequestException as e:
-            print(f"Error fetching NHL data: {e}")
+            logger.warning("Error fetching NHL schedule for %s: %s", game_date_str, e)
             return None
+
+        if not game_pk:
+            logger.info("No completed game found for team_id=%s on %s", team_id, game_date_str)
+        self._game_pk_cache[key] = game_pk
+        return game_pk
+
+    def _fetch_game_pk(self, team_id: int, date: datetime) -> Optional[int]:
+        """Scan the schedule for date and return team_id's completed game PK."""
+        game_date_str = date.strftime('%Y-%m-%d')
+        schedule_url = f"{self.base_url}/schedule/{game_date_str}"
+
+        schedule_response = cached_get(schedule_url,
+                                       expire_after=expire_after_for(date))
+        schedule_response.raise_for_status()
+        schedule_data = read_json(schedule_response)
+
+        if self.dump:
+            self._dump_json(schedule_response, "nhl_get_game_pk")
+
+        return next(
+            (
+                game['id']
+                for day in schedule_data.get('gameWeek') or ()
+                for game in day.get('games', ())
+                if str(game['gameState']) == self.FINAL_STATUS_CODE
+                and team_id in (game['homeTeam']['id'], game['awayTeam']['id'])
+            ),
+            None,
+        )
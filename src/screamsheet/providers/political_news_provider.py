@@ -5,10 +5,11 @@ from typing import Dict, List, Optional
 import time as _time
 
 import feedparser
-import requests
 from bs4 import BeautifulSoup
 
 from ..base import DataProvider
+from ._feeds import conditional_headers, feed_entries
+from ._http import pooled_get
 
 logger = logging.getLogger(__name__)
 _LOG_FMT = "[%(asctime)s] %(levelname)s %(name)s: %(message)s"
@@ -101,9 +102,9 @@ class PoliticalRSSProvider(DataProvider):
 
     def _fetch_source(self, name: str, url: str) -> List[Dict]:
         """Parse one RSS feed and return normalized entries within 48 hours."""
-        feed = feedparser.parse(url)
+        feed = feedparser.parse(url, **conditional_headers(url))
         results = []
-        for entry in feed.entries:
+        for entry in feed_entries(url, feed):
             normalized = self._normalize_rss_entry(entry, name)
             if normalized and self._within_48h(normalized["published"]):
                 results.append(normalized)
@@ -239,7 +240,7 @@ class WhiteHouseProvider(DataProvider):
 
     def _fetch_html(self) -> str:
         """Retrieve the briefing-room page and return its HTML."""
-        response = requests.get(self.URL, timeout=10)
+        response = pooled_get(self.URL, timeout=10, headers={"Accept": "text/html"})
         response.raise_for_status()
         return response.text
 
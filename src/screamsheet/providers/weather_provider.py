@@ -4,6 +4,8 @@ import requests
 from pathlib import Path
 from typing import List, Dict, Optional
 
+from ._http import pooled_get
+
 
 # Absolute path to icons bundled inside this package
 _ASSETS_ROOT = Path(__file__).parent.parent / 'assets' / 'weather'
@@ -129,14 +131,14 @@ class WeatherProvider:
         """Call the NWS API and return the raw periods list, or None."""
         try:
             points_url = f'{self._nws_base}/points/{self.lat},{self.lon}'
-            r = requests.get(points_url, headers=NWS_HEADERS, timeout=15)
+            r = pooled_get(points_url, headers=NWS_HEADERS, timeout=15)
             r.raise_for_status()
             forecast_url = r.json().get('forecast')
             if not forecast_url:
                 print('WeatherProvider: No forecast URL in NWS points response.')
                 return None
 
-            r2 = requests.get(forecast_url, headers=NWS_HEADERS, timeout=15)
+            r2 = pooled_get(forecast_url, headers=NWS_HEADERS, timeout=15)
             r2.raise_for_status()
             return r2.json().get('periods')
 
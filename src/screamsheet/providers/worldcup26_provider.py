@@ -13,9 +13,8 @@ import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
-import requests
-
 from ..base.data_provider import DataProvider
+from ._http import pooled_get
 
 logger = logging.getLogger(__name__)
 
@@ -110,7 +109,7 @@ class WorldCup26Provider(DataProvider):
         logger.info("GET %s", url)
         start = time.time()
         try:
-            resp = requests.get(url, timeout=10)
+            resp = pooled_get(url, timeout=10)
             elapsed = time.time() - start
             logger.info("  → HTTP %s (%.2fs)", resp.status_code, elapsed)
             resp.raise_for_status()
@@ -12,6 +12,27 @@ from ..base import Section, DataProvider
 
 logger = logging.getLogger(__name__)
 
+# MLB box score tables share one header/style definition; TableStyle is
+# copied into each Table by setStyle(), so a single instance is safe to reuse.
+_HITTING_HEADER = ("Batter", "AB", "R", "H", "HR", "RBI", "BB", "SO")
+_PITCHING_HEADER = ("Pitcher", "IP", "H", "R", "ER", "BB", "SO", "HR")
+_MLB_COL_WIDTHS = (100, 24, 24, 24, 24, 24, 24, 24)
+# Row keys in column order (after the name column) for each table.
+_BAT_KEYS = ('AB', 'R', 'H', 'HR', 'RBI', 'BB', 'SO')
+_PITCH_KEYS = ('IP', 'H', 'R', 'ER', 'BB', 'SO', 'HR')
+_MLB_TABLE_STYLE = TableStyle([
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 3),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 3),
+    ('TOPPADDING', (0, 0), (-1, -1), 2),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+])
+
 
 class BoxScoreSection(Section):
     """
@@ -139,74 +160,30 @@ class BoxScoreSection(Section):
         # Batting table
         batting_stats = boxscore_stats.get('batting_stats', [])
         if batting_stats:
-            hitting_header = ["Batter", "AB", "R", "H", "HR", "RBI", "BB", "SO"]
-            hitting_data = [hitting_header]
+            hitting_data = [list(_HITTING_HEADER)]
             
             for player in batting_stats:
-                row = [
-                    player['name'],
-                    str(player.get('AB', 0)),
-                    str(player.get('R', 0)),
-                    str(player.get('H', 0)),
-                    str(player.get('HR', 0)),
-                    str(player.get('RBI', 0)),
-                    str(player.get('BB', 0)),
-                    str(player.get('SO', 0))
-                ]
-                hitting_data.append(row)
-            
-            hitting_style = TableStyle([
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 8),
-                ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-                ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-                ('LEFTPADDING', (0, 0), (-1, -1), 3),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 3),
-                ('TOPPADDING', (0, 0), (-1, -1), 2),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-            ])
+                hitting_data.append(
+                    [player['name'], *[str(player.get(k, 0)) for k in _BAT_KEYS]]
+                )
             
-            hitting_table = Table(hitting_data, colWidths=[100, 24, 24, 24, 24, 24, 24, 24])
-            hitting_table.setStyle(hitting_style)
+            hitting_table = Table(hitting_data, colWidths=list(_MLB_COL_WIDTHS))
+            hitting_table.setStyle(_MLB_TABLE_STYLE)
             elements.append(hitting_table)
             elements.append(Spacer(1, 12))
         
         # Pitching table
         pitching_stats = boxscore_stats.get('pitching_stats', [])
         if pitching_stats:
-            pitching_header = ["Pitcher", "IP", "H", "R", "ER", "BB", "SO", "HR"]
-            pitching_data = [pitching_header]
+            pitching_data = [list(_PITCHING_HEADER)]
             
             for player in pitching_stats:
-                row = [
-                    player['name'],
-                    str(player.get('IP', 0)),
-                    str(player.get('H', 0)),
-                    str(player.get('R', 0)),
-                    str(player.get('ER', 0)),
-                    str(player.get('BB', 0)),
-                    str(player.get('SO', 0)),
-                    str(player.get('HR', 0))
-                ]
-                pitching_data.append(row)
-            
-            pitching_style = TableStyle([
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 8),
-                ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-                ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-                ('LEFTPADDING', (0, 0), (-1, -1), 3),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 3),
-                ('TOPPADDING', (0, 0), (-1, -1), 2),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-            ])
+                pitching_data.append(
+                    [player['name'], *[str(player.get(k, 0)) for k in _PITCH_KEYS]]
+                )
             
-            pitching_table = Table(pitching_data, colWidths=[100, 24, 24, 24, 24, 24, 24, 24])
-            pitching_table.setStyle(pitching_style)
+            pitching_table = Table(pitching_data, colWidths=list(_MLB_COL_WIDTHS))
+            pitching_table.setStyle(_MLB_TABLE_STYLE)
             elements.append(pitching_table)
         
         return elements
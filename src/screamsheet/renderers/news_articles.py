@@ -1,5 +1,6 @@
 """News articles section renderer."""
 import logging
+import re
 from typing import List, Any
 import os
 from dotenv import load_dotenv
@@ -14,6 +15,9 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# A run of non-empty lines: one summary paragraph between blank lines
+_PARAGRAPH_RE = re.compile(r'[^\n]+(?:\n[^\n]+)*')
+
 
 class NewsArticlesSection(Section):
     """
@@ -21,7 +25,7 @@ class NewsArticlesSection(Section):
     
     Shows summarized news articles from a news provider.
     """
-    
+
     def __init__(self, title: str, provider: DataProvider, max_articles: int = 4, start_index: int = 0, summarizer_class=None):
         super().__init__(title)
         self.provider = provider
@@ -53,6 +57,15 @@ class NewsArticlesSection(Section):
             fontName='Helvetica',
             fontSize=11,
         )
+        
+        self.article_date_style = ParagraphStyle(
+            name="ArticleDate",
+            parent=self.styles['Normal'],
+            fontName='Helvetica-Oblique',
+            fontSize=9,
+            textColor='#666666',
+            spaceAfter=6,
+        )
     
     def fetch_data(self):
         """Fetch articles from the provider."""
@@ -123,83 +136,84 @@ class NewsArticlesSection(Section):
                 self.data = []
     
     def _generate_summaries(self, articles: List[dict], summarizer) -> List[dict]:
-        """Generate LLM summaries for articles."""
-        from datetime import datetime
-        import time
-        
-        summarized_articles = []
-        
+        """Generate LLM summaries for articles.
+
+        The whole slice goes to the summarizer in one ``generate_summaries``
+        call: repeats are answered from the response cache and the rest are
+        sent as one concurrent batch.  Results keep article order.
+        """
+        if not articles:
+            return []
+
+        prepared = [self._prepare_article(article) for article in articles]
+
         # Check if summarizer has any available LLMs
         has_llm = (summarizer.llm_gemini is not None or summarizer.llm_grok is not None)
-        
-        for article in articles:
-            entry = article['entry']
-            title = entry.get('title', 'Untitled')
-            link = entry.get('link', '')
-            summary_text = entry.get('summary', '')
+        if not has_llm:
+            for story in prepared:
+                logger.warning(
+                    "No LLM available for article '%s', using original summary",
+                    story['title'][:60],
+                )
+            return [self._with_original_summary(story) for story in prepared]
+
+        llm_choice = 'gemini' if summarizer.llm_gemini is not None else 'grok'
+        # Format data as dict with title and summary (as expected by NewsSummarizer)
+        # Keep story data minimal and tied to each article
+        items = [
+            ({key: story[key] for key in ('id', 'title', 'summary', 'link')}, llm_choice)
+            for story in prepared
+        ]
+        try:
+            llm_summaries = summarizer.generate_summaries(items)
+        except Exception as e:
+            logger.warning("Error summarizing articles for '%s': %s", self.title, e)
+            return [self._with_original_summary(story) for story in prepared]
+
+        summarized = []
+        for story, llm_summary in zip(prepared, llm_summaries):
+            logger.info(
+                "Article '%s' summarized: %d words",
+                story['title'][:60], len(str(llm_summary).split()),
+            )
+            summarized.append({**self._output_fields(story), 'summary': llm_summary})
+        return summarized
+
+    @staticmethod
+    def _prepare_article(article: dict) -> dict:
+        """Pull the fields used for summarizing and rendering out of one article."""
+        from datetime import datetime
+        import time
+
+        entry = article['entry']
+        title = entry.get('title', 'Untitled')
+
+        # Extract and format publication date
+        pub_date_str = None
+        try:
+            if entry.get('published_parsed'):
+                pub_date = datetime.fromtimestamp(time.mktime(entry['published_parsed']))
+                pub_date_str = pub_date.strftime('%B %d, %Y')
+        except Exception as e:
+            logger.debug("Error parsing date for '%s': %s", title, e)
+
+        return {
+            'slot': article['slot'],
+            'id': entry.get('id', entry.get('link', '')),
+            'title': title,
+            'summary': entry.get('summary', ''),
+            'link': entry.get('link', ''),
+            'pub_date': pub_date_str,
+        }
+
+    @staticmethod
+    def _output_fields(story: dict) -> dict:
+        return {key: story[key] for key in ('slot', 'id', 'title', 'link', 'pub_date')}
+
+    def _with_original_summary(self, story: dict) -> dict:
+        """Render-ready entry using the truncated original summary."""
+        return {**self._output_fields(story), 'summary': story['summary'][:500] + '...'}
 
-            # Extract and format publication date
-            pub_date_str = None
-            try:
-                if entry.get('published_parsed'):
-                    pub_date = datetime.fromtimestamp(time.mktime(entry['published_parsed']))
-                    pub_date_str = pub_date.strftime('%B %d, %Y')
-            except Exception as e:
-                logger.debug("Error parsing date for '%s': %s", title, e)
-            
-            if has_llm:
-                try:
-                    # Generate summary using LLM
-                    # Format data as dict with title and summary (as expected by NewsSummarizer)
-                    # Keep story data minimal and tied to this article
-                    story_data = {
-                        'id': entry.get('id', entry.get('link', '')),
-                        'title': title,
-                        'summary': summary_text,
-                        'link': link,
-                    }
-                    _llm_choice = 'gemini' if summarizer.llm_gemini is not None else 'grok'
-                    llm_summary = summarizer.generate_summary(
-                        llm_choice=_llm_choice,
-                        data=story_data
-                    )
-                    word_count = len(str(llm_summary).split())
-                    logger.info("Article '%s' summarized: %d words", title[:60], word_count)
-                    
-                    summarized_articles.append({
-                        'slot': article['slot'],
-                        'id': story_data.get('id'),
-                        'title': title,
-                        'summary': llm_summary,
-                        'link': link,
-                        'pub_date': pub_date_str,
-                    })
-                except Exception as e:
-                    logger.warning("Error summarizing article '%s': %s", title[:60], e)
-                    import traceback
-                    traceback.print_exc()
-                    summarized_articles.append({
-                        'slot': article['slot'],
-                        'id': story_data.get('id'),
-                        'title': title,
-                        'summary': summary_text[:500] + '...',  # Truncated original
-                        'link': link,
-                        'pub_date': pub_date_str,
-                    })
-            else:
-                # No LLM available, use original summary
-                logger.warning("No LLM available for article '%s', using original summary", title[:60])
-                summarized_articles.append({
-                    'slot': article['slot'],
-                    'id': entry.get('id', entry.get('link', '')),
-                    'title': title,
-                    'summary': summary_text[:500] + '...',  # Truncated original
-                    'link': link,
-                    'pub_date': pub_date_str,
-                })
-        
-        return summarized_articles
-    
     def render(self) -> List[Any]:
         """Render the news articles section."""
         if not self.data:
@@ -220,9 +234,6 @@ class NewsArticlesSection(Section):
         right_column = []
         
         for i, article in enumerate(articles_to_render):
-            # Split summary into paragraphs on double newlines
-            summary_paragraphs = [p for p in article['summary'].split('\n\n') if p.strip()]
-            
             article_elements = [
                 Paragraph(f"<b>{article['title']}</b>", self.article_heading_style),
             ]
@@ -234,18 +245,13 @@ class NewsArticlesSection(Section):
             if article.get('pub_date'):
                 byline_parts.append(article['pub_date'])
             if byline_parts:
-                date_style = ParagraphStyle(
-                    name="ArticleDate",
-                    parent=self.styles['Normal'],
-                    fontName='Helvetica-Oblique',
-                    fontSize=9,
-                    textColor='#666666',
-                    spaceAfter=6,
-                )
-                article_elements.append(Paragraph(" — ".join(byline_parts), date_style))
+                article_elements.append(Paragraph(" — ".join(byline_parts), self.article_date_style))
             
             # Add each paragraph as a separate Paragraph element
-            for paragraph in summary_paragraphs:
+            for match in _PARAGRAPH_RE.finditer(article['summary']):
+                paragraph = match.group()
+                if not paragraph.strip():
+                    continue
                 article_elements.append(Paragraph(paragraph, self.article_text_style))
                 article_elements.append(Spacer(1, 6))  # Smaller spacer between paragraphs
             
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import dataclasses
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Callable
@@ -36,6 +37,25 @@ logger = logging.getLogger(__name__)
 # Fields on ScreamsheetOrder that control execution but are not sheet keys.
 _SKIP_FIELDS: frozenset[str] = frozenset({"output"})
 
+# Upper bound on sheets generated concurrently by run_order().
+_MAX_WORKERS = 4
+
+# Sheets that may run on run_order()'s thread pool.  These spend their time
+# waiting on HTTP and LLM calls and share only thread-safe state: the pooled
+# and SQLite-backed HTTP sessions, and the feed and LLM caches, which write
+# through a per-thread temp file and os.replace.  The NHL player and team
+# tables serialise their writes behind a module lock.
+#
+# Anything not listed runs serially on the calling thread.  "sky" is left
+# out on purpose: pyswisseph keeps process-global C state and skyfield
+# downloads its ephemeris on first use, and the work is CPU-bound, so a
+# thread would not shorten it anyway.  New sheets start serial until they
+# have been checked.
+_THREAD_SAFE_SHEETS: frozenset[str] = frozenset({
+    "nhl", "nhl_news", "mlb", "nba", "nfl", "mlb_news", "mlb_trade_rumors",
+    "french_mlb_news", "presidential", "worldcup", "home_run_derby",
+})
+
 
 def _output_path(output_dir: str, basename: str) -> str:
     """Return the full path for a generated PDF.
@@ -230,6 +250,19 @@ def _run_home_run_derby(
     return sheet.generate()
 
 
+def _run_sheet(
+    name: str, options: Any, today: datetime, today_str: str, output_dir: str
+) -> str | Exception:
+    """Run one registry handler, returning its PDF path or the exception it raised."""
+    try:
+        pdf_path = _REGISTRY[name](options, today, today_str, output_dir)
+    except Exception as exc:
+        logger.error("Sheet '%s' failed: %s", name, exc)
+        return exc
+    logger.info("Generated: %s", pdf_path)
+    return pdf_path
+
+
 # ---------------------------------------------------------------------------
 # Registry — maps ScreamsheetOrder field names to their handler functions.
 # ---------------------------------------------------------------------------
@@ -265,8 +298,10 @@ def run_order(
 
     Returns:
         A ``ScreamsheetResult`` describing what was generated and any errors.
-        Per-sheet exceptions are caught; the sheet is added to errors and the
-        loop continues.
+        Sheets in ``_THREAD_SAFE_SHEETS`` run concurrently (up to
+        ``_MAX_WORKERS`` at a time) while the rest run serially on the calling
+        thread; per-sheet exceptions are caught and the sheet is added to
+        errors without affecting the others.
     """
     if today is None:
         today = datetime.now()
@@ -278,6 +313,7 @@ def run_order(
 
     result = ScreamsheetResult(subscriber_name=subscriber_name)
 
+    jobs: list[tuple[str, Any]] = []
     for f in dataclasses.fields(order):
         if f.name in _SKIP_FIELDS:
             continue
@@ -290,14 +326,34 @@ def run_order(
                 f.name,
             )
             continue
-        try:
-            pdf_path = _REGISTRY[f.name](options, today, today_str, output_dir)
-            logger.info("Generated: %s", pdf_path)
-            result.sheets_generated.append(Path(pdf_path).name)
-            result.options_summary[f.name] = _options_summary_entry(f.name, options)
-        except Exception as exc:
-            logger.error("Sheet '%s' failed: %s", f.name, exc)
-            result.errors.append(f"{f.name}: {exc}")
+        jobs.append((f.name, options))
+
+    if not jobs:
+        return result
+
+    # Thread-safe sheets spend most of their time waiting on HTTP and LLM
+    # calls, so they run on a pool while the remaining sheets run here, one
+    # at a time.  Results are recorded back in field order so the report does
+    # not depend on completion order.
+    pooled = [(name, options) for name, options in jobs if name in _THREAD_SAFE_SHEETS]
+    serial = [(name, options) for name, options in jobs if name not in _THREAD_SAFE_SHEETS]
+    outcomes: dict[str, str | Exception] = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(_MAX_WORKERS, len(pooled)))) as executor:
+        futures = {
+            name: executor.submit(_run_sheet, name, options, today, today_str, output_dir)
+            for name, options in pooled
+        }
+        for name, options in serial:
+            outcomes[name] = _run_sheet(name, options, today, today_str, output_dir)
+        for name, future in futures.items():
+            outcomes[name] = future.result()
+
+    for name, options in jobs:
+        outcome = outcomes[name]
+        if isinstance(outcome, Exception):
+            result.errors.append(f"{name}: {outcome}")
+            continue
+        result.sheets_generated.append(Path(outcome).name)
+        result.options_summary[name] = _options_summary_entry(name, options)
 
     return result
-
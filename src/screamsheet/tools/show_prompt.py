@@ -13,7 +13,6 @@ Usage
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from datetime import datetime, timedelta
 from typing import Any, Callable, Dict, Optional, Tuple
@@ -171,13 +170,15 @@ _SEP = "=" * 72
 
 def _print_prompt(label: str, data: Dict[str, Any], summarizer: Any) -> None:
     """Print input variables, the filled template, and the full final prompt."""
+    from screamsheet.llm.base import prompt_data_json
+
     filled: str = summarizer._build_llm_prompt(data)
 
     # Reconstruct the full string that LangChain assembles before sending to the LLM.
     # See BaseGameSummaryGenerator._setup_prompt_chain in llm/base.py.
     full_prompt = (
         "Here is the input data:\n\n"
-        + json.dumps(data, indent=2)
+        + prompt_data_json(data)
         + "\n\nInstruction: "
         + filled
     )
@@ -4,6 +4,52 @@ from unittest.mock import MagicMock
 
 import pandas as pd
 import pytest
+import requests
+
+from screamsheet.db import _nhl_db_shared
+from screamsheet.providers import _http
+
+
+# ---------------------------------------------------------------------------
+# HTTP cache
+# ---------------------------------------------------------------------------
+
+class _PassthroughSession:
+    """Stand-in for the shared provider sessions that defers to ``requests.get``.
+
+    Keeps tests that patch ``requests.get`` working for pooled and cached
+    lookups and stops the suite from reading or writing the on-disk HTTP cache.
+    Keyword arguments (``timeout``, ``headers``, ``expire_after``) are passed
+    through so tests can check what each call site sends.
+    """
+
+    def get(self, url, **kwargs):
+        return requests.get(url, **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def _no_shared_sessions(monkeypatch):
+    monkeypatch.setattr(_http, "_get_session", _PassthroughSession)
+    monkeypatch.setattr(_http, "_get_cached_session", _PassthroughSession)
+
+
+@pytest.fixture(autouse=True)
+def _llm_cache_in_tmp(monkeypatch, tmp_path):
+    """Keep the LLM response cache out of the DB directory and working tree."""
+    monkeypatch.setenv("SCREAMSHEET_LLM_CACHE", str(tmp_path / "llm_cache"))
+
+
+@pytest.fixture(autouse=True)
+def _feed_cache_in_tmp(monkeypatch, tmp_path):
+    """Keep stored RSS validators out of the DB directory and working tree."""
+    monkeypatch.setenv("SCREAMSHEET_FEED_CACHE", str(tmp_path / "feed_cache"))
+
+
+@pytest.fixture(autouse=True)
+def _dispose_db_engines():
+    """Close the shared SQLite engines each test opens under tmp_path."""
+    yield
+    _nhl_db_shared.dispose_engines()
 
 
 # ---------------------------------------------------------------------------
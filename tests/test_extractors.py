@@ -1,9 +1,15 @@
 """Unit tests for screamsheet.providers.extractors."""
 from unittest.mock import patch, MagicMock
 
+import orjson
 import pytest
 
-from screamsheet.providers.extractors import MLBGameExtractor, NHLGameExtractor
+from screamsheet.providers.extractors import (
+    MAX_NARRATIVE_PLAYS,
+    MLBGameExtractor,
+    NHLGameExtractor,
+    _select_narrative,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -13,7 +19,7 @@ from screamsheet.providers.extractors import MLBGameExtractor, NHLGameExtractor
 class TestMLBGameExtractorFetchRawData:
     def _schedule_mock(self, game_pk=2025000001):
         m = MagicMock()
-        m.json.return_value = {
+        m.content = orjson.dumps({
             "totalItems": 1,
             "dates": [
                 {
@@ -28,12 +34,12 @@ class TestMLBGameExtractorFetchRawData:
                     ]
                 }
             ],
-        }
+        })
         return m
 
     def _live_mock(self, raw_data):
         m = MagicMock()
-        m.json.return_value = raw_data
+        m.content = orjson.dumps(raw_data)
         return m
 
     def test_returns_dict_on_success(self, mlb_live_feed_response):
@@ -45,17 +51,34 @@ class TestMLBGameExtractorFetchRawData:
 
     def test_returns_none_when_no_game_found(self):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {"totalItems": 0, "dates": []}
+        mock_resp.content = orjson.dumps({"totalItems": 0, "dates": []})
         with patch("requests.get", return_value=mock_resp):
             result = MLBGameExtractor.fetch_raw_data(team_id=143, date_str="2025-03-15")
         assert result is None
 
+    def test_known_game_pk_skips_schedule_lookup(self, mlb_live_feed_response):
+        live_mock = self._live_mock(mlb_live_feed_response)
+        with patch("requests.get", return_value=live_mock) as mock_get:
+            result = MLBGameExtractor.fetch_raw_data(
+                team_id=143, date_str="2025-03-15", game_pk=2025000001
+            )
+        assert isinstance(result, dict)
+        mock_get.assert_called_once()
+        assert "/game/2025000001/feed/live" in mock_get.call_args.args[0]
+        assert mock_get.call_args.kwargs["params"] == {"fields": MLBGameExtractor.FEED_FIELDS}
+
     def test_returns_none_on_request_error(self):
         import requests as req_lib
         with patch("requests.get", side_effect=req_lib.exceptions.RequestException("fail")):
             result = MLBGameExtractor.fetch_raw_data(team_id=143, date_str="2025-03-15")
         assert result is None
 
+    def test_returns_none_on_malformed_date(self):
+        with patch("requests.get") as mock_get:
+            result = MLBGameExtractor.fetch_raw_data(team_id=143, date_str="03/15/2025")
+        assert result is None
+        mock_get.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # MLBGameExtractor.extract_key_info
@@ -88,6 +111,62 @@ class TestMLBGameExtractorExtractKeyInfo:
         result = MLBGameExtractor.extract_key_info({"bad": "data"})
         assert isinstance(result, str)
 
+    def test_long_games_keep_key_plays_in_order(self, mlb_live_feed_response):
+        filler = [{"result": {"event": "Groundout", "description": f"Groundout {i}."}} for i in range(60)]
+        plays = filler[:30] + [
+            {"result": {"event": "Single", "description": "Single, Bohm scores."}},
+        ] + filler[30:] + [
+            {"result": {"event": "Home Run", "description": "Harper homers."}},
+        ]
+        mlb_live_feed_response["liveData"]["plays"]["allPlays"] = plays
+        snippets = MLBGameExtractor.extract_key_info(mlb_live_feed_response)["narrative_snippets"]
+        assert snippets.count("Groundout") == 38
+        assert snippets.index("Bohm scores") < snippets.index("Harper homers")
+
+    def test_single_beats_walk_for_last_narrative_slot(self, mlb_live_feed_response):
+        runs = [
+            {"result": {"event": "Sac Fly", "description": f"Sac fly {i}.", "rbi": 1}}
+            for i in range(MAX_NARRATIVE_PLAYS - 1)
+        ]
+        plays = [
+            {"result": {"event": "Walk", "description": "Schwarber walks."}},
+            *runs,
+            {"result": {"event": "Single", "description": "Turner singles."}},
+        ]
+        mlb_live_feed_response["liveData"]["plays"]["allPlays"] = plays
+        snippets = MLBGameExtractor.extract_key_info(mlb_live_feed_response)["narrative_snippets"]
+        assert "Turner singles." in snippets
+        assert "Schwarber walks." not in snippets
+
+    def test_scoring_flag_outranks_hits(self, mlb_live_feed_response):
+        hits = [
+            {"result": {"event": "Double", "description": f"Double {i}."}}
+            for i in range(MAX_NARRATIVE_PLAYS)
+        ]
+        error = {"result": {"event": "Field Error", "description": "Stott reaches on an error."},
+                 "about": {"isScoringPlay": True}}
+        mlb_live_feed_response["liveData"]["plays"]["allPlays"] = hits + [error]
+        snippets = MLBGameExtractor.extract_key_info(mlb_live_feed_response)["narrative_snippets"]
+        assert snippets.endswith("Stott reaches on an error.")
+        assert f"Double {MAX_NARRATIVE_PLAYS - 1}." not in snippets
+
+
+# ---------------------------------------------------------------------------
+# _select_narrative
+# ---------------------------------------------------------------------------
+
+class TestSelectNarrative:
+    def test_everything_within_budget_is_kept(self):
+        assert _select_narrative([(2, "a."), (0, "b.")], max_plays=5) == "a. b."
+
+    def test_lowest_ranks_win_and_game_order_is_kept(self):
+        ranked = [(2, "a."), (0, "b."), (1, "c."), (2, "d.")]
+        assert _select_narrative(ranked, max_plays=2) == "b. c."
+
+    def test_char_budget(self):
+        ranked = [(1, "aaaa"), (0, "bbbb"), (1, "cc")]
+        assert _select_narrative(ranked, max_chars=7) == "bbbb cc"
+
 
 # ---------------------------------------------------------------------------
 # NHLGameExtractor._lookup_player  (uses DB cache via _db_lookup_player)
@@ -136,6 +215,25 @@ class TestNHLGameExtractorLookupPlayer:
                 extractor._lookup_player(8478402)
         mock_get.assert_not_called()
 
+    def test_repeated_lookups_hit_db_once_per_player(self):
+        cached = {
+            "player_id": 8478402,
+            "player_first_name": "Connor",
+            "player_last_name": "McDavid",
+        }
+        extractor = NHLGameExtractor()
+        with patch("screamsheet.providers.extractors._db_lookup_player", return_value=cached) as mock_lookup:
+            names = [extractor._lookup_player(8478402) for _ in range(5)]
+        assert names == ["Connor McDavid"] * 5
+        mock_lookup.assert_called_once_with(player_id=8478402)
+
+    def test_misses_are_indexed_too(self):
+        extractor = NHLGameExtractor()
+        with patch("screamsheet.providers.extractors._db_lookup_player", return_value=None) as mock_lookup:
+            extractor._lookup_player(9999999)
+            extractor._lookup_player(9999999)
+        mock_lookup.assert_called_once()
+
 
 # ---------------------------------------------------------------------------
 # NHLGameExtractor._lookup_team  (uses DB cache via _db_lookup_team)
@@ -180,3 +278,83 @@ class TestNHLGameExtractorLookupTeam:
             with patch("requests.get") as mock_get:
                 extractor._lookup_team(22)
         mock_get.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# NHLGameExtractor._prefetch_players
+# ---------------------------------------------------------------------------
+
+class TestNHLGameExtractorPrefetchPlayers:
+    _PLAYS = [
+        {"typeDescKey": "goal", "details": {"scoringPlayerId": 1, "assist1PlayerId": 2, "goalieInNetId": 3}},
+        {"typeDescKey": "hit", "details": {"hittingPlayerId": 2, "hitteePlayerId": 4}},
+        {"typeDescKey": "faceoff", "details": {"winningPlayerId": 5}},
+    ]
+
+    def test_resolves_each_narrative_player_once(self):
+        extractor = NHLGameExtractor()
+        with patch("screamsheet.providers.extractors._db_lookup_player", return_value=None) as mock_lookup:
+            extractor._prefetch_players(self._PLAYS)
+            extractor._prefetch_players(self._PLAYS)
+        looked_up = sorted(c.kwargs["player_id"] for c in mock_lookup.call_args_list)
+        assert looked_up == [1, 2, 3, 4]
+
+    def test_lookup_errors_do_not_propagate(self):
+        extractor = NHLGameExtractor()
+        with patch("screamsheet.providers.extractors._db_lookup_player", side_effect=RuntimeError("db locked")):
+            extractor._prefetch_players(self._PLAYS)
+        assert extractor._player_index == {}
+
+
+# ---------------------------------------------------------------------------
+# NHLGameExtractor play parsers
+# ---------------------------------------------------------------------------
+
+class TestNHLGameExtractorParsers:
+    @pytest.fixture
+    def extractor(self):
+        extractor = NHLGameExtractor()
+        extractor._player_index.update({1: "Travis Konecny", 2: "Sean Couturier", 3: "Owen Tippett", 4: "Igor Shesterkin"})
+        extractor._team_index.update({4: "Philadelphia Flyers"})
+        return extractor
+
+    def test_goal_with_two_assists(self, extractor):
+        details = {"scoringPlayerId": 1, "assist1PlayerId": 2, "assist2PlayerId": 3,
+                   "goalieInNetId": 4, "eventOwnerTeamId": 4}
+        assert extractor._parse_goal(details) == (
+            "Travis Konecny (Philadelphia Flyers) scored on Igor Shesterkin"
+            " assisted by Sean Couturier and Owen Tippett"
+        )
+
+    def test_unassisted_goal(self, extractor):
+        details = {"scoringPlayerId": 1, "goalieInNetId": 4, "eventOwnerTeamId": 4}
+        assert extractor._parse_goal(details) == (
+            "Travis Konecny (Philadelphia Flyers) scored on Igor Shesterkin"
+        )
+
+    def test_penalty_with_drawn_by(self, extractor):
+        details = {"descKey": "tripping", "duration": 2, "typeCode": "MIN",
+                   "committedByPlayerId": 2, "drawnByPlayerId": 4, "eventOwnerTeamId": 4}
+        assert extractor._parse_penalty(details) == (
+            "2 MIN penalty for Sean Couturier (Philadelphia Flyers) for tripping"
+            " (drawn by Igor Shesterkin)"
+        )
+
+    def test_missing_detail_keys_do_not_raise(self, extractor):
+        assert extractor._parse_hit({"hittingPlayerId": 1}) == "Travis Konecny (N/A Team) hit N/A"
+
+    def test_build_narrative_dispatches_on_type(self, extractor):
+        play = {"typeDescKey": "takeaway", "periodDescriptor": {"number": 2}, "timeRemaining": "12:34",
+                "details": {"playerId": 1, "eventOwnerTeamId": 4, "zoneCode": "N"}}
+        assert extractor._build_narrative(play) == (
+            "[Period 2, 12:34] Takeaway by Travis Konecny (Philadelphia Flyers) in zone N."
+        )
+
+    def test_build_narrative_uses_subclass_parser(self):
+        class TerseExtractor(NHLGameExtractor):
+            def _parse_takeaway(self, details):
+                return "Takeaway"
+
+        play = {"typeDescKey": "takeaway", "periodDescriptor": {"number": 1}, "timeRemaining": "5:00",
+                "details": {"zoneCode": "O"}}
+        assert TerseExtractor()._build_narrative(play) == "[Period 1, 5:00] Takeaway in zone O."
@@ -0,0 +1,76 @@
+"""Unit tests for screamsheet.providers._feeds."""
+import json
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from screamsheet.providers._feeds import (
+    conditional_headers,
+    feed_entries,
+    get_feed_cache_dir,
+)
+
+URL = "https://example.com/feed"
+
+
+def _make_feed(entries, status=200, etag=None, modified=None):
+    feed = MagicMock()
+    feed.entries = entries
+    feed.get.side_effect = {"status": status, "etag": etag, "modified": modified}.get
+    return feed
+
+
+class TestGetFeedCacheDir:
+    def test_env_override(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("SCREAMSHEET_FEED_CACHE", str(tmp_path / "feeds"))
+        assert get_feed_cache_dir() == tmp_path / "feeds"
+
+    def test_default_sits_next_to_db(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("SCREAMSHEET_FEED_CACHE", raising=False)
+        monkeypatch.setenv("SCREAMSHEET_DB", str(tmp_path / "screamsheet.db"))
+        assert get_feed_cache_dir() == Path(tmp_path) / "feed_cache"
+
+
+class TestConditionalGet:
+    def test_first_fetch_sends_no_validators(self):
+        assert conditional_headers(URL) == {}
+
+    def test_validators_sent_after_fetch(self):
+        feed_entries(URL, _make_feed([{"title": "a"}], etag='"v1"',
+                                     modified="Mon, 01 Jan 2024 00:00:00 GMT"))
+        assert conditional_headers(URL) == {
+            "etag": '"v1"', "modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+
+    def test_not_modified_returns_stored_entries(self):
+        feed_entries(URL, _make_feed([{"title": "a"}], etag='"v1"'))
+        assert feed_entries(URL, _make_feed([], status=304)) == [{"title": "a"}]
+
+    def test_not_modified_without_stored_state_uses_feed(self):
+        assert feed_entries(URL, _make_feed([], status=304)) == []
+
+    def test_feed_without_validators_is_not_stored(self):
+        entries = [{"title": "a"}]
+        assert feed_entries(URL, _make_feed(entries)) is entries
+        assert conditional_headers(URL) == {}
+
+    def test_stored_entries_keep_only_plain_fields(self):
+        published = time.struct_time((2024, 1, 1, 12, 0, 0, 0, 1, 0))
+        entry = {"title": "a", "link": "https://x/a", "published_parsed": published,
+                 "content": [{"value": "<p>body</p>"}], "author_detail": object()}
+        feed_entries(URL, _make_feed([entry], etag='"v1"'))
+        stored = feed_entries(URL, _make_feed([], status=304))
+        assert stored == [{"title": "a", "link": "https://x/a", "published_parsed": published}]
+        assert isinstance(stored[0]["published_parsed"], time.struct_time)
+
+    def test_state_is_stored_as_json(self):
+        feed_entries(URL, _make_feed([{"title": "a"}], etag='"v1"'))
+        (path,) = get_feed_cache_dir().glob("*.json")
+        assert json.loads(path.read_text())["entries"] == [{"title": "a"}]
+
+    def test_corrupt_state_is_ignored(self):
+        feed_entries(URL, _make_feed([{"title": "a"}], etag='"v1"'))
+        (path,) = get_feed_cache_dir().glob("*.json")
+        path.write_text("{not json")
+        assert conditional_headers(URL) == {}
+        assert feed_entries(URL, _make_feed([], status=304)) == []
@@ -0,0 +1,99 @@
+"""Unit tests for screamsheet.providers._http."""
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from screamsheet.providers._http import (
+    DEFAULT_TIMEOUT,
+    FINAL_EXPIRE_AFTER,
+    LIVE_EXPIRE_AFTER,
+    _configure_session,
+    cached_get,
+    expire_after_for,
+    get_cache_path,
+    pooled_get,
+    read_json,
+)
+
+
+# ---------------------------------------------------------------------------
+# read_json
+# ---------------------------------------------------------------------------
+
+class TestReadJson:
+    def test_decodes_bytes_body(self):
+        resp = MagicMock()
+        resp.content = b'{"dates": [{"games": []}]}'
+        assert read_json(resp) == {"dates": [{"games": []}]}
+
+    def test_invalid_body_raises_request_exception(self):
+        resp = MagicMock()
+        resp.content = b"<html>not json</html>"
+        with pytest.raises(requests.exceptions.RequestException):
+            read_json(resp)
+
+
+# ---------------------------------------------------------------------------
+# cache lifetime / location
+# ---------------------------------------------------------------------------
+
+class TestExpireAfterFor:
+    def test_past_date_uses_long_lifetime(self):
+        assert expire_after_for(date.today() - timedelta(days=1)) == FINAL_EXPIRE_AFTER
+
+    def test_today_uses_short_lifetime(self):
+        assert expire_after_for(datetime.now()) == LIVE_EXPIRE_AFTER
+
+
+class TestGetCachePath:
+    def test_env_override(self, monkeypatch, tmp_path):
+        target = tmp_path / "cache.sqlite"
+        monkeypatch.setenv("SCREAMSHEET_HTTP_CACHE", str(target))
+        assert get_cache_path() == target
+
+    def test_default_sits_next_to_db(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("SCREAMSHEET_HTTP_CACHE", raising=False)
+        monkeypatch.setenv("SCREAMSHEET_DB", str(tmp_path / "screamsheet.db"))
+        assert get_cache_path() == Path(tmp_path) / "http_cache.sqlite"
+
+
+class TestConfigureSession:
+    def test_gateway_errors_are_retried(self):
+        session = requests.Session()
+        _configure_session(session)
+        retries = session.get_adapter("https://example.com").max_retries
+        assert retries.total == 2
+        assert {502, 503, 504} <= set(retries.status_forcelist)
+
+
+# ---------------------------------------------------------------------------
+# request keyword arguments
+# ---------------------------------------------------------------------------
+
+class TestPooledGet:
+    def test_default_timeout_applied(self):
+        with patch("requests.get") as mock_get:
+            pooled_get("https://example.com/a")
+        assert mock_get.call_args.kwargs["timeout"] == DEFAULT_TIMEOUT
+
+    def test_caller_timeout_and_headers_kept(self):
+        with patch("requests.get") as mock_get:
+            pooled_get("https://example.com/a", timeout=15, headers={"Accept": "text/html"})
+        assert mock_get.call_args.kwargs["timeout"] == 15
+        assert mock_get.call_args.kwargs["headers"] == {"Accept": "text/html"}
+
+
+class TestCachedGet:
+    def test_expire_after_passed_per_request(self):
+        with patch("requests.get") as mock_get:
+            cached_get("https://example.com/a", expire_after=LIVE_EXPIRE_AFTER)
+        assert mock_get.call_args.kwargs["expire_after"] == LIVE_EXPIRE_AFTER
+        assert mock_get.call_args.kwargs["timeout"] == DEFAULT_TIMEOUT
+
+    def test_expire_after_omitted_uses_session_default(self):
+        with patch("requests.get") as mock_get:
+            cached_get("https://example.com/a")
+        assert "expire_after" not in mock_get.call_args.kwargs
@@ -1,4 +1,5 @@
 """Unit tests for screamsheet.llm.summary (BaseGameSummaryGenerator and subclasses)."""
+from datetime import timedelta
 from unittest.mock import patch, MagicMock
 
 import pytest
@@ -11,6 +12,13 @@ from screamsheet.llm.summary import (
 )
 
 
+def _fake_llm(**kwargs):
+    """Return a runnable chat-model stand-in and the mock recording its calls."""
+    from langchain_core.runnables import RunnableLambda
+    calls = MagicMock(**kwargs)
+    return RunnableLambda(lambda prompt: calls(prompt)), calls
+
+
 # ---------------------------------------------------------------------------
 # BaseGameSummaryGenerator initialization
 # ---------------------------------------------------------------------------
@@ -21,6 +29,24 @@ class TestBaseGameSummaryGeneratorInit:
         assert gen.llm_gemini is None
         assert gen.llm_grok is None
 
+    def test_llm_clients_built_on_first_use(self):
+        with patch.object(NHLGameSummarizer, "_initialize_gemini", return_value="gemini-llm") as mock_init:
+            gen = NHLGameSummarizer(gemini_api_key="key", grok_api_key=None)
+            mock_init.assert_not_called()
+            assert gen.llm_gemini == "gemini-llm"
+            assert gen.llm_gemini == "gemini-llm"
+        mock_init.assert_called_once_with("key")
+
+    def test_summarizers_share_chat_client_for_same_settings(self):
+        with patch("langchain_google_genai.ChatGoogleGenerativeAI") as mock_chat:
+            from screamsheet.llm.base import _gemini_client
+            _gemini_client.cache_clear()
+            first = NHLGameSummarizer(gemini_api_key="key").llm_gemini
+            second = NewsSummarizer(gemini_api_key="key").llm_gemini
+            _gemini_client.cache_clear()
+        assert first is second
+        mock_chat.assert_called_once()
+
     def test_api_keys_stored(self):
         gen = NHLGameSummarizer(gemini_api_key=None, grok_api_key=None)
         assert gen.api_keys["gemini"] is None
@@ -102,6 +128,228 @@ class TestGenerateSummaryWithMockedChain:
         assert result == "The Flyers won in hilarious fashion."
 
 
+class TestPipelineReuse:
+    def test_prompt_chain_built_once_per_instance(self):
+        gen = NHLGameSummarizer(gemini_api_key=None, grok_api_key=None)
+        with patch.object(gen, "_setup_prompt_chain", return_value=MagicMock()) as setup:
+            assert gen._prompt_chain is gen._prompt_chain
+        setup.assert_called_once()
+
+    def test_pipeline_assembled_once_per_llm_choice(self):
+        gen = NHLGameSummarizer(gemini_api_key=None, grok_api_key=None)
+        gen.llm_gemini = MagicMock()
+        with patch.object(gen, "_build_pipeline", return_value=MagicMock()) as build:
+            first = gen._pipeline_for("gemini")
+            assert gen._pipeline_for("GEMINI") is first
+        build.assert_called_once()
+
+
+class TestGenerateSummaryRendersPromptOnce:
+    def test_prompt_rendered_once_and_sent_to_llm(self):
+        gen = NHLGameSummarizer(gemini_api_key=None, grok_api_key=None)
+        data = {"home_team": "Flyers", "away_team": "Devils",
+                "home_score": 4, "away_score": 2, "narrative_snippets": ""}
+        prompt_chain = MagicMock()
+        prompt_chain.invoke.return_value.to_string.return_value = "rendered prompt"
+        gen.llm_gemini, llm_calls = _fake_llm(return_value="The Flyers won.")
+        with patch.object(gen, "_setup_prompt_chain", return_value=prompt_chain):
+            result = gen.generate_summary(llm_choice="gemini", data=data)
+        assert result == "The Flyers won."
+        prompt_chain.invoke.assert_called_once()
+        llm_calls.assert_called_once_with(prompt_chain.invoke.return_value)
+
+    def test_blocking_call_uses_cached_pipeline(self):
+        gen = NHLGameSummarizer(gemini_api_key=None, grok_api_key=None)
+        data = {"home_team": "Flyers", "away_team": "Devils",
+                "home_score": 4, "away_score": 2, "narrative_snippets": ""}
+        pipeline = MagicMock()
+        pipeline.invoke.return_value = "The Flyers won."
+        with patch.object(gen, "_build_pipeline", return_value=pipeline) as build:
+            gen.generate_summary(llm_choice="gemini", data=data, cache=False)
+            gen.generate_summary(llm_choice="gemini", data=data, cache=False)
+            list(gen.generate_summary_stream("gemini", data, cache=False))
+        build.assert_called_once()
+        assert pipeline.invoke.call_count == 2
+
+
+class TestResponseCache:
+    _DATA = {"home_team": "Flyers", "away_team": "Devils",
+             "home_score": 4, "away_score": 2, "narrative_snippets": ""}
+
+    def _generator(self, **llm_kwargs):
+        gen = NHLGameSummarizer(gemini_api_key=None, grok_api_key=None)
+        llm_kwargs.setdefault("return_value", "The Flyers won.")
+        gen.llm_gemini, self.llm_calls = _fake_llm(**llm_kwargs)
+        return gen
+
+    def test_identical_prompt_served_from_cache(self):
+        gen = self._generator()
+        first = gen.generate_summary(llm_choice="gemini", data=self._DATA)
+        second = gen.generate_summary(llm_choice="gemini", data=self._DATA)
+        assert first == second == "The Flyers won."
+        self.llm_calls.assert_called_once()
+
+    def test_cache_false_forces_model_call(self):
+        gen = self._generator()
+        gen.generate_summary(llm_choice="gemini", data=self._DATA)
+        gen.generate_summary(llm_choice="gemini", data=self._DATA, cache=False)
+        assert self.llm_calls.call_count == 2
+
+    def test_failed_generation_is_not_cached(self):
+        gen = self._generator(side_effect=[RuntimeError("boom"), "The Flyers won."])
+        assert gen.generate_summary(llm_choice="gemini", data=self._DATA) == "Summary generation failed."
+        assert gen.generate_summary(llm_choice="gemini", data=self._DATA) == "The Flyers won."
+
+    def test_expired_entry_is_ignored(self, monkeypatch):
+        from screamsheet.llm import response_cache
+        gen = self._generator()
+        gen.generate_summary(llm_choice="gemini", data=self._DATA)
+        monkeypatch.setattr(response_cache, "CACHE_TTL", timedelta(seconds=-1))
+        gen.generate_summary(llm_choice="gemini", data=self._DATA)
+        assert self.llm_calls.call_count == 2
+
+
+class TestPromptChain:
+    def test_renders_data_and_instruction(self):
+        gen = NHLGameSummarizer(gemini_api_key=None, grok_api_key=None)
+        data = {"home_team": "Flyers", "away_team": "Devils",
+                "home_score": 4, "away_score": 2, "narrative_snippets": ""}
+        text = gen._prompt_chain.invoke({"data": data, "llm_choice": "gemini"}).to_string()
+        assert text.startswith('Here is the input data:\n\n{"home_team":"Flyers"')
+        assert "\n\nInstruction: " in text
+        assert text.endswith(gen._build_llm_prompt(data))
+
+
+class TestPromptDataJson:
+    def test_compact_output(self):
+        from screamsheet.llm.base import prompt_data_json
+        assert prompt_data_json({"home_team": "Flyers", "score": [4, 2]}) == '{"home_team":"Flyers","score":[4,2]}'
+
+    def test_non_string_keys_are_stringified(self):
+        from screamsheet.llm.base import prompt_data_json
+        assert prompt_data_json({1: "a"}) == '{"1":"a"}'
+
+
+# ---------------------------------------------------------------------------
+# generate_summary_stream
+# ---------------------------------------------------------------------------
+
+class TestGenerateSummaryStream:
+    _DATA = {"home_team": "Flyers", "away_team": "Devils",
+             "home_score": 4, "away_score": 2, "narrative_snippets": ""}
+
+    def test_string_data_is_yielded_unchanged(self):
+        gen = NHLGameSummarizer(gemini_api_key=None, grok_api_key=None)
+        assert list(gen.generate_summary_stream("gemini", "no game data")) == ["no game data"]
+
+    def test_yields_pipeline_chunks(self):
+        gen = NHLGameSummarizer(gemini_api_key=None, grok_api_key=None)
+        pipeline = MagicMock()
+        pipeline.stream.return_value = iter(["The Flyers ", "won."])
+        with patch.object(gen, "_build_pipeline", return_value=pipeline):
+            chunks = list(gen.generate_summary_stream("gemini", self._DATA))
+        assert chunks == ["The Flyers ", "won."]
+
+    def test_failure_before_first_chunk_yields_message(self):
+        gen = NHLGameSummarizer(gemini_api_key=None, grok_api_key=None)
+        pipeline = MagicMock()
+        pipeline.stream.side_effect = RuntimeError("boom")
+        with patch.object(gen, "_build_pipeline", return_value=pipeline):
+            chunks = list(gen.generate_summary_stream("gemini", self._DATA))
+        assert chunks == ["Summary generation failed."]
+
+    def test_streamed_summary_is_cached(self):
+        gen = NHLGameSummarizer(gemini_api_key=None, grok_api_key=None)
+        pipeline = MagicMock()
+        pipeline.stream.return_value = iter(["The Flyers ", "won."])
+        with patch.object(gen, "_build_pipeline", return_value=pipeline):
+            list(gen.generate_summary_stream("gemini", self._DATA))
+            cached = list(gen.generate_summary_stream("gemini", self._DATA))
+        assert cached == ["The Flyers won."]
+        pipeline.stream.assert_called_once()
+
+    def test_shares_cache_with_generate_summary(self):
+        gen = NHLGameSummarizer(gemini_api_key=None, grok_api_key=None)
+        gen.llm_gemini, _ = _fake_llm(return_value="The Flyers won.")
+        gen.generate_summary(llm_choice="gemini", data=self._DATA)
+        pipeline = MagicMock()
+        with patch.object(gen, "_build_pipeline", return_value=pipeline):
+            chunks = list(gen.generate_summary_stream("gemini", self._DATA))
+        assert chunks == ["The Flyers won."]
+        pipeline.stream.assert_not_called()
+
+    def test_failed_stream_is_not_cached(self):
+        gen = NHLGameSummarizer(gemini_api_key=None, grok_api_key=None)
+        pipeline = MagicMock()
+        pipeline.stream.side_effect = [RuntimeError("boom"), iter(["ok"])]
+        with patch.object(gen, "_build_pipeline", return_value=pipeline):
+            list(gen.generate_summary_stream("gemini", self._DATA))
+            chunks = list(gen.generate_summary_stream("gemini", self._DATA))
+        assert chunks == ["ok"]
+
+    def test_cache_false_forces_model_call(self):
+        gen = NHLGameSummarizer(gemini_api_key=None, grok_api_key=None)
+        pipeline = MagicMock()
+        pipeline.stream.side_effect = lambda prompt: iter(["ok"])
+        with patch.object(gen, "_build_pipeline", return_value=pipeline):
+            list(gen.generate_summary_stream("gemini", self._DATA))
+            list(gen.generate_summary_stream("gemini", self._DATA, cache=False))
+        assert pipeline.stream.call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# generate_summaries — one batched pipeline call per LLM
+# ---------------------------------------------------------------------------
+
+class TestGenerateSummaries:
+    _DATA = {"home_team": "Flyers", "away_team": "Devils",
+             "home_score": 4, "away_score": 2, "narrative_snippets": ""}
+    _OTHER = {"home_team": "Rangers", "away_team": "Devils",
+              "home_score": 1, "away_score": 3, "narrative_snippets": ""}
+
+    def test_batches_items_and_keeps_order(self):
+        gen = NHLGameSummarizer(gemini_api_key=None, grok_api_key=None)
+        pipeline = MagicMock()
+        pipeline.batch.return_value = ["first", "second"]
+        with patch.object(gen, "_build_pipeline", return_value=pipeline):
+            result = gen.generate_summaries(
+                [(self._DATA, "gemini"), ("no game data", "gemini"), (self._OTHER, "gemini")]
+            )
+        assert result == ["first", "no game data", "second"]
+        pipeline.batch.assert_called_once()
+        assert len(pipeline.batch.call_args.args[0]) == 2
+
+    def test_failed_item_gets_failure_text(self):
+        gen = NHLGameSummarizer(gemini_api_key=None, grok_api_key=None)
+        pipeline = MagicMock()
+        pipeline.batch.return_value = [RuntimeError("boom"), "ok"]
+        with patch.object(gen, "_build_pipeline", return_value=pipeline):
+            result = gen.generate_summaries([(self._DATA, "gemini"), (self._OTHER, "gemini")])
+        assert result == ["Summary generation failed.", "ok"]
+
+    def test_no_llm_choice_returns_default_text(self):
+        gen = NHLGameSummarizer(gemini_api_key=None, grok_api_key=None)
+        assert gen.generate_summaries([(self._DATA, "")]) == [gen.config.default_text]
+
+    def test_cached_items_skip_the_batch(self):
+        gen = NHLGameSummarizer(gemini_api_key=None, grok_api_key=None)
+        pipeline = MagicMock()
+        pipeline.batch.side_effect = lambda prompts, **kwargs: [f"summary {i}" for i in range(len(prompts))]
+        with patch.object(gen, "_build_pipeline", return_value=pipeline):
+            gen.generate_summaries([(self._DATA, "gemini")])
+            result = gen.generate_summaries([(self._DATA, "gemini"), (self._OTHER, "gemini")])
+        assert result == ["summary 0", "summary 0"]
+        assert len(pipeline.batch.call_args.args[0]) == 1
+
+    def test_failed_item_is_not_cached(self):
+        gen = NHLGameSummarizer(gemini_api_key=None, grok_api_key=None)
+        pipeline = MagicMock()
+        pipeline.batch.side_effect = [[RuntimeError("boom")], ["ok"]]
+        with patch.object(gen, "_build_pipeline", return_value=pipeline):
+            gen.generate_summaries([(self._DATA, "gemini")])
+            assert gen.generate_summaries([(self._DATA, "gemini")]) == ["ok"]
+
+
 # ---------------------------------------------------------------------------
 # _build_llm_prompt sanity checks
 # ---------------------------------------------------------------------------
@@ -138,6 +386,12 @@ class TestBuildLLMPrompt:
         assert isinstance(prompt, str)
         assert len(prompt) > 20
 
+    def test_static_news_prompt_returned_unformatted(self):
+        from screamsheet.llm import summarizers
+        gen = NewsSummarizer(gemini_api_key=None, grok_api_key=None)
+        prompt = gen._build_llm_prompt({"title": "x", "summary": "y"})
+        assert prompt is summarizers._load_prompt(NewsSummarizer._PROMPT_FILE)
+
 
 # ---------------------------------------------------------------------------
 # LLMConfig
@@ -169,9 +423,47 @@ class TestLLMConfig:
         # Unset fields keep their defaults
         assert cfg.grok_model == "grok-4-fast"
 
+    def test_news_summarizer_uses_lite_gemini_model(self):
+        gen = NewsSummarizer(gemini_api_key=None, grok_api_key=None)
+        assert gen.config.gemini_model == "gemini-2.5-flash-lite"
+
+    def test_game_summarizer_keeps_default_gemini_model(self):
+        from screamsheet.llm.config import DEFAULT_LLM_CONFIG
+        gen = NHLGameSummarizer(gemini_api_key=None, grok_api_key=None)
+        assert gen.config.gemini_model == DEFAULT_LLM_CONFIG.gemini_model
+
+    def test_default_request_budget(self):
+        from screamsheet.llm.config import DEFAULT_LLM_CONFIG
+        assert DEFAULT_LLM_CONFIG.request_timeout == 30.0
+        assert DEFAULT_LLM_CONFIG.max_retries == 3
+
+    def test_request_budget_passed_to_chat_clients(self):
+        from screamsheet.llm.base import _gemini_client
+        from screamsheet.llm.config import LLMConfig
+        _gemini_client.cache_clear()
+        config = LLMConfig(request_timeout=12.0, max_retries=1)
+        with patch("langchain_google_genai.ChatGoogleGenerativeAI") as mock_chat:
+            NHLGameSummarizer(gemini_api_key="key", config=config).llm_gemini
+        _gemini_client.cache_clear()
+        kwargs = mock_chat.call_args.kwargs
+        assert kwargs["timeout"] == 12.0
+        assert kwargs["max_retries"] == 1
+
     def test_base_generator_accepts_custom_config(self):
         from screamsheet.llm.config import LLMConfig
         from screamsheet.llm.summarizers import NHLGameSummarizer
         cfg = LLMConfig(gemini_model="gemini-test")
         gen = NHLGameSummarizer(config=cfg)
         assert gen.config.gemini_model == "gemini-test"
+
+    def test_prompt_file_read_once_per_process(self):
+        from screamsheet.llm import summarizers
+
+        summarizers._load_prompt.cache_clear()
+        with patch.object(summarizers.Path, "read_text", return_value="{home_team}") as mock_read:
+            first = MLBGameSummarizer(gemini_api_key=None, grok_api_key=None)
+            second = MLBGameSummarizer(gemini_api_key=None, grok_api_key=None)
+            assert first._build_llm_prompt(self._sample_data()) == "Flyers"
+            assert second._build_llm_prompt(self._sample_data()) == "Flyers"
+        summarizers._load_prompt.cache_clear()
+        mock_read.assert_called_once()
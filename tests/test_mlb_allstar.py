@@ -1,5 +1,6 @@
 """Tests for MLB All-Star Game screamsheet and provider methods."""
 import pytest
+import orjson
 from datetime import datetime
 from unittest.mock import patch, MagicMock
 
@@ -42,7 +43,7 @@ def test_mlb_allstar_build_sections():
 def test_get_allstar_game_scores(mock_get):
     """Test get_allstar_game_scores parsing."""
     mock_response = MagicMock()
-    mock_response.json.return_value = {
+    mock_response.content = orjson.dumps({
         "dates": [
             {
                 "games": [
@@ -58,7 +59,7 @@ def test_get_allstar_game_scores(mock_get):
                 ]
             }
         ]
-    }
+    })
     mock_get.return_value = mock_response
 
     provider = MLBDataProvider()
@@ -76,7 +77,7 @@ def test_get_allstar_box_scores(mock_get):
     def mock_requests_get(url, params=None):
         m = MagicMock()
         if "schedule" in url:
-            m.json.return_value = {
+            m.content = orjson.dumps({
                 "dates": [
                     {
                         "games": [
@@ -88,9 +89,9 @@ def test_get_allstar_box_scores(mock_get):
                         ]
                     }
                 ]
-            }
+            })
         elif "boxscore" in url:
-            m.json.return_value = {
+            m.content = orjson.dumps({
                 "teams": {
                     "away": {
                         "team": {"id": 159, "name": "American League All-Stars"},
@@ -111,7 +112,7 @@ def test_get_allstar_box_scores(mock_get):
                         }
                     }
                 }
-            }
+            })
         return m
 
     mock_get.side_effect = mock_requests_get
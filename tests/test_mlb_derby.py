@@ -1,5 +1,6 @@
 """Unit tests for MLB Home Run Derby data provider and Markdown renderer."""
 import pytest
+import orjson
 from datetime import datetime
 from unittest.mock import patch, MagicMock
 
@@ -97,7 +98,7 @@ def test_get_derby_game_pk(provider, mock_schedule_response):
     """Test get_derby_game_pk finds the correct event ID while ignoring testing sessions."""
     with patch("requests.get") as mock_get:
         mock_resp = MagicMock()
-        mock_resp.json.return_value = mock_schedule_response
+        mock_resp.content = orjson.dumps(mock_schedule_response)
         mock_get.return_value = mock_resp
         
         game_pk = provider.get_derby_game_pk(datetime(2024, 7, 15))
@@ -109,7 +110,7 @@ def test_fetch_derby_bracket(provider, mock_bracket_response):
     with patch("requests.get") as mock_get:
         mock_resp = MagicMock()
         mock_resp.status_code = 200
-        mock_resp.json.return_value = mock_bracket_response
+        mock_resp.content = orjson.dumps(mock_bracket_response)
         mock_get.return_value = mock_resp
         
         bracket = provider.fetch_derby_bracket(773161)
@@ -124,7 +125,7 @@ def test_fetch_derby_statcast(provider, mock_statcast_response):
     with patch("requests.get") as mock_get:
         mock_resp = MagicMock()
         mock_resp.status_code = 200
-        mock_resp.json.return_value = mock_statcast_response
+        mock_resp.content = orjson.dumps(mock_statcast_response)
         mock_get.return_value = mock_resp
         
         statcast = provider.fetch_derby_statcast(773161)
@@ -308,6 +308,28 @@ class TestMLBNewsRssProviderScrapeArticleText:
             result = provider._scrape_article_text("https://mlb.com/article/1")
         assert result == ""
 
+    def test_scrape_fetches_each_url_once(
+        self, provider: MLBNewsRssProvider
+    ) -> None:
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.text = FAKE_MLB_HTML
+        with patch("requests.get", return_value=mock_resp) as mock_get:
+            first = provider._scrape_article_text("https://mlb.com/article/1")
+            second = provider._scrape_article_text("https://mlb.com/article/1")
+        assert first == second
+        mock_get.assert_called_once()
+
+    def test_scrape_requests_html(self, provider: MLBNewsRssProvider) -> None:
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.text = FAKE_MLB_HTML
+        with patch("requests.get", return_value=mock_resp) as mock_get:
+            provider._scrape_article_text("https://mlb.com/article/1")
+        kwargs = mock_get.call_args.kwargs
+        assert kwargs["headers"]["Accept"].startswith("text/html")
+        assert kwargs["timeout"] == MLBNewsRssProvider._SCRAPE_TIMEOUT
+
 
 # ---------------------------------------------------------------------------
 # sanitize_articles — body text enrichment
@@ -351,3 +373,27 @@ class TestMLBNewsRssProviderBodyEnrichment:
         mock_scrape.assert_not_called()
         assert result[0]["entry"]["summary"] == original_summary
 
+
+
+# ---------------------------------------------------------------------------
+# Feed caching — sections sharing a provider parse each feed once
+# ---------------------------------------------------------------------------
+
+
+class TestMLBNewsRssProviderFeedCache:
+    def test_each_feed_parsed_once_across_get_articles_calls(
+        self, provider: MLBNewsRssProvider
+    ) -> None:
+        parsed_urls: list = []
+
+        def fake_parse(url: str) -> MagicMock:
+            parsed_urls.append(url)
+            feed = MagicMock()
+            feed.entries = [{"title": f"Article {len(parsed_urls)}", "link": url, "summary": "test"}]
+            return feed
+
+        with patch("feedparser.parse", side_effect=fake_parse):
+            first = provider.get_articles()
+            second = provider.get_articles()
+        assert first == second
+        assert len(parsed_urls) == len(set(parsed_urls))
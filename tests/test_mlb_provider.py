@@ -2,6 +2,7 @@
 from datetime import datetime
 from unittest.mock import patch, MagicMock
 
+import orjson
 import pandas as pd
 import pytest
 
@@ -20,7 +21,7 @@ def provider():
 class TestMLBGetGameScores:
     def test_returns_list_of_games(self, provider, mlb_schedule_response, sample_date):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = mlb_schedule_response
+        mock_resp.content = orjson.dumps(mlb_schedule_response)
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_game_scores(sample_date)
         assert isinstance(result, list)
@@ -28,7 +29,7 @@ class TestMLBGetGameScores:
 
     def test_game_has_required_keys(self, provider, mlb_schedule_response, sample_date):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = mlb_schedule_response
+        mock_resp.content = orjson.dumps(mlb_schedule_response)
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_game_scores(sample_date)
         game = result[0]
@@ -37,7 +38,7 @@ class TestMLBGetGameScores:
 
     def test_correct_teams_parsed(self, provider, mlb_schedule_response, sample_date):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = mlb_schedule_response
+        mock_resp.content = orjson.dumps(mlb_schedule_response)
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_game_scores(sample_date)
         assert result[0]["home_team"] == "Philadelphia Phillies"
@@ -45,7 +46,7 @@ class TestMLBGetGameScores:
 
     def test_correct_scores_parsed(self, provider, mlb_schedule_response, sample_date):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = mlb_schedule_response
+        mock_resp.content = orjson.dumps(mlb_schedule_response)
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_game_scores(sample_date)
         assert result[0]["home_score"] == 5
@@ -53,7 +54,7 @@ class TestMLBGetGameScores:
 
     def test_empty_dates_returns_empty_list(self, provider, sample_date):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {"dates": []}
+        mock_resp.content = orjson.dumps({"dates": []})
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_game_scores(sample_date)
         assert result == []
@@ -68,11 +69,11 @@ class TestMLBGetStandings:
         """Return different mocks for schedule vs. division API calls."""
         mock = MagicMock()
         if "divisions" in url:
-            mock.json.return_value = {
+            mock.content = orjson.dumps({
                 "divisions": [{"name": "National League East"}]
-            }
+            })
         else:
-            mock.json.return_value = {
+            mock.content = orjson.dumps({
                 "records": [
                     {
                         "division": {"link": "/api/v1/divisions/204"},
@@ -90,7 +91,7 @@ class TestMLBGetStandings:
                         ],
                     }
                 ]
-            }
+            })
         return mock
 
     def test_returns_dataframe(self, provider):
@@ -113,13 +114,78 @@ class TestMLBGetStandings:
 
     def test_empty_records_returns_empty_df(self, provider):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {"records": []}
+        mock_resp.content = orjson.dumps({"records": []})
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_standings(season=2025)
         assert isinstance(result, pd.DataFrame)
         assert result.empty
 
 
+# ---------------------------------------------------------------------------
+# _get_game_pk
+# ---------------------------------------------------------------------------
+
+class TestMLBGetGamePk:
+    def test_requests_trimmed_schedule_fields(self, provider, sample_date):
+        mock_resp = MagicMock()
+        mock_resp.content = orjson.dumps({"dates": []})
+        with patch("requests.get", return_value=mock_resp) as mock_get:
+            provider._get_game_pk(team_id=143, date=sample_date)
+        params = mock_get.call_args.kwargs["params"]
+        assert params["fields"] == MLBDataProvider.GAME_PK_FIELDS
+        assert params["teamId"] == 143
+
+    def test_returns_game_pk_for_final_game(self, provider, sample_date):
+        mock_resp = MagicMock()
+        mock_resp.content = orjson.dumps({
+            "dates": [{"games": [{
+                "gamePk": 745528,
+                "status": {"abstractGameCode": "F", "detailedState": "Final"},
+                "teams": {"away": {"team": {"id": 121}}, "home": {"team": {"id": 143}}},
+            }]}]
+        })
+        with patch("requests.get", return_value=mock_resp):
+            assert provider._get_game_pk(team_id=143, date=sample_date) == 745528
+
+    def test_schedule_fetched_once_per_team_and_date(self, provider, sample_date):
+        mock_resp = MagicMock()
+        mock_resp.content = orjson.dumps({"dates": []})
+        with patch("requests.get", return_value=mock_resp) as mock_get:
+            provider._get_game_pk(team_id=143, date=sample_date)
+            provider._get_game_pk(team_id=143, date=sample_date)
+        assert mock_get.call_count == 1
+
+    def test_request_error_is_not_memoised(self, provider, sample_date):
+        import requests as req_lib
+        mock_resp = MagicMock()
+        mock_resp.content = orjson.dumps({"dates": []})
+        with patch("requests.get", side_effect=[req_lib.exceptions.RequestException("fail"), mock_resp]) as mock_get:
+            with pytest.raises(req_lib.exceptions.RequestException):
+                provider._get_game_pk(team_id=143, date=sample_date)
+            assert provider._get_game_pk(team_id=143, date=sample_date) is None
+        assert mock_get.call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# get_box_score
+# ---------------------------------------------------------------------------
+
+class TestMLBGetBoxScore:
+    def test_result_is_memoised_per_team_and_date(self, provider, sample_date):
+        box = {"batting_stats": [], "pitching_stats": []}
+        with patch.object(provider, "_fetch_box_score", return_value=box) as mock_fetch:
+            first = provider.get_box_score(team_id=143, date=sample_date)
+            second = provider.get_box_score(team_id=143, date=sample_date)
+        assert first is second is box
+        mock_fetch.assert_called_once_with(143, sample_date)
+
+    def test_failed_lookup_is_retried(self, provider, sample_date):
+        with patch.object(provider, "_fetch_box_score", return_value=None) as mock_fetch:
+            provider.get_box_score(team_id=143, date=sample_date)
+            provider.get_box_score(team_id=143, date=sample_date)
+        assert mock_fetch.call_count == 2
+
+
 # ---------------------------------------------------------------------------
 # has_game
 # ---------------------------------------------------------------------------
@@ -147,7 +213,7 @@ class TestMLBGetAllTeamsForDate:
         self, provider, mlb_final_games_response, sample_date
     ):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = mlb_final_games_response
+        mock_resp.content = orjson.dumps(mlb_final_games_response)
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_all_teams_for_date(sample_date)
         assert (143, "Philadelphia Phillies") in result
@@ -166,14 +232,14 @@ class TestMLBGetAllTeamsForDate:
             }]}]
         }
         mock_resp = MagicMock()
-        mock_resp.json.return_value = in_progress
+        mock_resp.content = orjson.dumps(in_progress)
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_all_teams_for_date(sample_date)
         assert result == []
 
     def test_returns_empty_when_no_dates(self, provider, sample_date):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {"dates": []}
+        mock_resp.content = orjson.dumps({"dates": []})
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_all_teams_for_date(sample_date)
         assert result == []
@@ -104,3 +104,56 @@ class TestMLBTRGetArticles:
         with patch("feedparser.parse", return_value=fake_feed):
             result = provider.get_articles()
         assert len(result) <= provider.max_articles
+
+    def test_team_slots_and_general_fill_order(self, provider):
+        def _entry(title, n):
+            return {"title": title, "summary": "Enough summary text for the article.",
+                    "link": f"https://example.com/{n}"}
+        entries = [
+            _entry("League Notes", 0),
+            _entry("Yankees Trade Talk", 1),
+            _entry("Phillies Sign Pitcher", 2),
+            _entry("Phillies Extend Catcher", 3),
+            _entry("Padres Add Reliever", 4),
+        ]
+        fake_feed = MagicMock()
+        fake_feed.entries = entries
+        with patch("feedparser.parse", return_value=fake_feed):
+            result = provider.get_articles()
+        assert [(item["slot"], item["entry"]["link"]) for item in result] == [
+            ("Section 1", "https://example.com/0"),
+            ("Section 2", "https://example.com/2"),
+            ("Section 3", "https://example.com/4"),
+            ("Section 4", "https://example.com/1"),
+        ]
+
+    def test_stops_reading_feed_once_slots_are_filled(self, provider):
+        def _entries():
+            yield {"title": "League Notes", "summary": "General news.", "link": "a"}
+            yield {"title": "Phillies News", "summary": "Phillies news.", "link": "b"}
+            yield {"title": "Padres News", "summary": "Padres news.", "link": "c"}
+            yield {"title": "Yankees News", "summary": "Yankees news.", "link": "d"}
+            raise AssertionError("feed read past the last needed entry")
+        fake_feed = MagicMock()
+        fake_feed.entries = _entries()
+        with patch("feedparser.parse", return_value=fake_feed):
+            result = provider.get_articles()
+        assert [item["entry"]["link"] for item in result] == ["a", "b", "c", "d"]
+
+    def test_feed_parsed_once_for_sections_sharing_provider(self, provider, rss_entry):
+        fake_feed = MagicMock()
+        fake_feed.entries = [rss_entry]
+        with patch("feedparser.parse", return_value=fake_feed) as mock_parse:
+            first = provider.get_articles()
+            second = provider.get_articles()
+        assert first is second
+        mock_parse.assert_called_once()
+
+    def test_team_match_ignores_case(self, provider):
+        entry = {"title": "PHILLIES land ace in blockbuster", "summary": "Trade news.",
+                 "link": "https://example.com/phillies"}
+        fake_feed = MagicMock()
+        fake_feed.entries = [entry]
+        with patch("feedparser.parse", return_value=fake_feed):
+            result = provider.get_articles()
+        assert result == [{"slot": "Section 2", "entry": entry}]
@@ -191,3 +191,66 @@ class TestNewsArticlesSectionPageSlot:
         news_sections = [s for s in sections if isinstance(s, NewsArticlesSection)]
         assert len(news_sections) >= 2
         assert news_sections[1].page_slot == "back"
+
+
+# ---------------------------------------------------------------------------
+# NewsArticlesSection — one batched summarizer call per section
+# ---------------------------------------------------------------------------
+
+class TestNewsArticlesSectionSummaries:
+    @staticmethod
+    def _articles(n):
+        return [
+            {'slot': i, 'entry': {'id': f'id-{i}', 'title': f'Story {i}', 'summary': 'text', 'link': ''}}
+            for i in range(n)
+        ]
+
+    def test_slice_summarized_in_one_call_and_keeps_order(self):
+        summarizer = MagicMock()
+        summarizer.llm_grok = None
+        summarizer.generate_summaries.side_effect = lambda items: [
+            f"summary of {data['title']}" for data, _ in items
+        ]
+        section = NewsArticlesSection(title="Test", provider=MagicMock())
+        result = section._generate_summaries(self._articles(4), summarizer)
+        summarizer.generate_summaries.assert_called_once()
+        items = summarizer.generate_summaries.call_args.args[0]
+        assert [choice for _, choice in items] == ['gemini'] * 4
+        assert [a['slot'] for a in result] == [0, 1, 2, 3]
+        assert [a['summary'] for a in result] == [f"summary of Story {i}" for i in range(4)]
+
+    def test_failed_summaries_fall_back_to_original_text(self):
+        summarizer = MagicMock()
+        summarizer.generate_summaries.side_effect = RuntimeError("boom")
+        section = NewsArticlesSection(title="Test", provider=MagicMock())
+        result = section._generate_summaries(self._articles(2), summarizer)
+        assert [a['summary'] for a in result] == ['text...', 'text...']
+
+    def test_no_llm_uses_original_text(self):
+        summarizer = MagicMock()
+        summarizer.llm_gemini = None
+        summarizer.llm_grok = None
+        section = NewsArticlesSection(title="Test", provider=MagicMock())
+        result = section._generate_summaries(self._articles(2), summarizer)
+        summarizer.generate_summaries.assert_not_called()
+        assert [a['summary'] for a in result] == ['text...', 'text...']
+
+    def test_no_articles_returns_empty_list(self):
+        section = NewsArticlesSection(title="Test", provider=MagicMock())
+        assert section._generate_summaries([], MagicMock()) == []
+
+
+# ---------------------------------------------------------------------------
+# NewsArticlesSection — summary text split into paragraphs
+# ---------------------------------------------------------------------------
+
+class TestNewsArticlesSectionParagraphs:
+    def test_blank_lines_separate_paragraphs(self):
+        from reportlab.platypus import Paragraph
+
+        section = NewsArticlesSection(title="Test", provider=MagicMock())
+        section.data = [{'title': 'Story', 'summary': 'First\nline two\n\n\nSecond\n\n   \n\nThird\n'}]
+        table = section.render()[0]
+        left_column = table._cellvalues[0][0]
+        texts = [el.text for el in left_column if isinstance(el, Paragraph)]
+        assert texts[1:] == ['First\nline two', 'Second', 'Third']
@@ -1,6 +1,7 @@
 """Unit tests for screamsheet.providers.nhl_boxscore."""
 from unittest.mock import patch, MagicMock
 
+import orjson
 import pytest
 
 from screamsheet.providers.nhl_boxscore import (
@@ -20,7 +21,7 @@ from reportlab.platypus import Table
 class TestGetGameBoxscore:
     def test_returns_dict_on_success(self, nhl_boxscore_response):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = nhl_boxscore_response
+        mock_resp.content = orjson.dumps(nhl_boxscore_response)
         with patch("requests.get", return_value=mock_resp):
             result = get_game_boxscore(2025020001)
         assert isinstance(result, dict)
@@ -128,6 +129,18 @@ class TestCreateNHLBoxscoreTables:
         result = create_nhl_boxscore_tables(sample_stats)
         assert isinstance(result["goalie_table"], Table)
 
+    def test_goalie_save_percentage_is_formatted(self, sample_stats):
+        result = create_nhl_boxscore_tables(sample_stats)
+        assert result["goalie_table"]._cellvalues[1][3] == "0.933"
+
+    def test_goalie_without_shots_shows_na(self):
+        stats = {
+            "skater_stats": [],
+            "goalie_stats": [PlayerGoalie("Backup", 0, 0, None)],
+        }
+        result = create_nhl_boxscore_tables(stats)
+        assert result["goalie_table"]._cellvalues[1][3] == "N/A"
+
     def test_empty_stats_still_returns_tables(self):
         result = create_nhl_boxscore_tables(
             {"skater_stats": [], "goalie_stats": []}
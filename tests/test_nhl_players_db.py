@@ -4,9 +4,11 @@ import json
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import orjson
 import pytest
 
 from screamsheet.db.nhl_players_db import (
+    _player_api_hits,
     get_db_path,
     init_db,
     lookup_player,
@@ -25,6 +27,14 @@ from screamsheet.db.nhl_players_sync import (
 # Shared fixtures
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(autouse=True)
+def _clear_api_memo():
+    """Keep the process-wide API memo from leaking between tests."""
+    _player_api_hits.clear()
+    yield
+    _player_api_hits.clear()
+
+
 @pytest.fixture
 def mem_db(tmp_path):
     """Initialised SQLite DB in a temp directory (not in-memory, so multiple
@@ -85,6 +95,20 @@ class TestInitDb:
         assert isinstance(result, Path)
         assert result.name == "screamsheet.db"
 
+    def test_lookups_reuse_one_engine_per_path(self, mem_db):
+        with patch("screamsheet.db.nhl_players_db.init_db", wraps=init_db) as mock_init:
+            for _ in range(2):
+                lookup_player_by_id(8478402, mem_db)
+        assert mock_init.call_count == 1
+
+    def test_least_recently_used_engine_disposed_past_limit(self, tmp_path):
+        from screamsheet.db import _nhl_db_shared
+        first = _nhl_db_shared.engine_for(tmp_path / "0.db", init_db)
+        with patch.object(first, "dispose") as dispose:
+            for i in range(1, _nhl_db_shared._MAX_ENGINES + 1):
+                _nhl_db_shared.engine_for(tmp_path / f"{i}.db", init_db)
+        dispose.assert_called_once()
+
 
 # ---------------------------------------------------------------------------
 # upsert_players
@@ -206,7 +230,7 @@ class TestLookupPlayer:
             "currentTeamAbbrev": "EDM",
         }
         mock_resp = MagicMock()
-        mock_resp.json.return_value = api_payload
+        mock_resp.content = orjson.dumps(api_payload)
         with patch("screamsheet.db.nhl_players_db.requests.get", return_value=mock_resp):
             result = lookup_player(player_id=8478402, db_path=mem_db)
         assert result is not None
@@ -220,7 +244,7 @@ class TestLookupPlayer:
             "currentTeamAbbrev": "EDM",
         }
         mock_resp = MagicMock()
-        mock_resp.json.return_value = api_payload
+        mock_resp.content = orjson.dumps(api_payload)
         with patch("screamsheet.db.nhl_players_db.requests.get", return_value=mock_resp):
             lookup_player(player_id=8478402, db_path=mem_db)
         # Second call must hit the cache — no further API call
@@ -238,6 +262,32 @@ class TestLookupPlayer:
             result = lookup_player(player_id=9999999, db_path=mem_db)
         assert result is None
 
+    def test_successful_api_lookup_is_not_repeated(self, mem_db, tmp_path):
+        mock_resp = MagicMock()
+        mock_resp.content = orjson.dumps({"lastName": {"default": "McDavid"}})
+        with patch(
+            "screamsheet.db.nhl_players_db.requests.get", return_value=mock_resp
+        ) as mock_get:
+            lookup_player(player_id=8478402, db_path=mem_db)
+            other_db = tmp_path / "other.db"
+            init_db(other_db)
+            result = lookup_player(player_id=8478402, db_path=other_db)
+        mock_get.assert_called_once()
+        assert result["player_last_name"] == "McDavid"
+
+    def test_failed_api_lookup_is_retried(self, mem_db):
+        import requests as req_lib
+        mock_resp = MagicMock()
+        mock_resp.content = orjson.dumps({"lastName": {"default": "McDavid"}})
+        with patch(
+            "screamsheet.db.nhl_players_db.requests.get",
+            side_effect=[req_lib.exceptions.Timeout("timeout"), mock_resp],
+        ) as mock_get:
+            assert lookup_player(player_id=8478402, db_path=mem_db) is None
+            result = lookup_player(player_id=8478402, db_path=mem_db)
+        assert mock_get.call_count == 2
+        assert result["player_last_name"] == "McDavid"
+
     def test_name_lookup_when_no_player_id(self, mem_db, mcdavid):
         upsert_players([mcdavid], mem_db)
         result = lookup_player(last_name="McDavid", db_path=mem_db)
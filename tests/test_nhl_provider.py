@@ -2,6 +2,7 @@
 from datetime import datetime
 from unittest.mock import patch, MagicMock
 
+import orjson
 import pandas as pd
 import pytest
 
@@ -20,7 +21,7 @@ def provider():
 class TestNHLGetGameScores:
     def test_returns_list_of_games(self, provider, nhl_schedule_response, sample_date):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = nhl_schedule_response
+        mock_resp.content = orjson.dumps(nhl_schedule_response)
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_game_scores(sample_date)
         assert isinstance(result, list)
@@ -28,7 +29,7 @@ class TestNHLGetGameScores:
 
     def test_game_has_required_keys(self, provider, nhl_schedule_response, sample_date):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = nhl_schedule_response
+        mock_resp.content = orjson.dumps(nhl_schedule_response)
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_game_scores(sample_date)
         game = result[0]
@@ -38,7 +39,7 @@ class TestNHLGetGameScores:
 
     def test_full_team_name_constructed(self, provider, nhl_schedule_response, sample_date):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = nhl_schedule_response
+        mock_resp.content = orjson.dumps(nhl_schedule_response)
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_game_scores(sample_date)
         assert result[0]["away_team"] == "Philadelphia Flyers"
@@ -46,7 +47,7 @@ class TestNHLGetGameScores:
 
     def test_scores_parsed(self, provider, nhl_schedule_response, sample_date):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = nhl_schedule_response
+        mock_resp.content = orjson.dumps(nhl_schedule_response)
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_game_scores(sample_date)
         assert result[0]["away_score"] == 4
@@ -55,7 +56,7 @@ class TestNHLGetGameScores:
     def test_non_final_game_excluded(self, provider, sample_date):
         """Games with state 'PREVIEW' should not appear in results."""
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {
+        mock_resp.content = orjson.dumps({
             "gameWeek": [
                 {
                     "games": [
@@ -78,14 +79,14 @@ class TestNHLGetGameScores:
                     ]
                 }
             ]
-        }
+        })
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_game_scores(sample_date)
         assert result == []
 
     def test_empty_game_week_returns_empty(self, provider, sample_date):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {"gameWeek": [{"games": []}]}
+        mock_resp.content = orjson.dumps({"gameWeek": [{"games": []}]})
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_game_scores(sample_date)
         assert result == []
@@ -98,21 +99,21 @@ class TestNHLGetGameScores:
 class TestNHLGetStandings:
     def test_returns_dataframe(self, provider, nhl_standings_response):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = nhl_standings_response
+        mock_resp.content = orjson.dumps(nhl_standings_response)
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_standings()
         assert isinstance(result, pd.DataFrame)
 
     def test_dataframe_has_team_column(self, provider, nhl_standings_response):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = nhl_standings_response
+        mock_resp.content = orjson.dumps(nhl_standings_response)
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_standings()
         assert "team" in result.columns
 
     def test_dataframe_has_expected_columns(self, provider, nhl_standings_response):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = nhl_standings_response
+        mock_resp.content = orjson.dumps(nhl_standings_response)
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_standings()
         for col in ("conference", "division", "GP", "W", "L"):
@@ -126,7 +127,7 @@ class TestNHLGetStandings:
 class TestNHLGetGamePk:
     def test_returns_game_pk_for_matching_team(self, provider, sample_date):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {
+        mock_resp.content = orjson.dumps({
             "gameWeek": [
                 {
                     "games": [
@@ -139,14 +140,14 @@ class TestNHLGetGamePk:
                     ]
                 }
             ]
-        }
+        })
         with patch("requests.get", return_value=mock_resp):
             pk = provider._get_game_pk(team_id=4, date=sample_date)
         assert pk == 2025020001
 
     def test_returns_none_when_no_matching_game(self, provider, sample_date):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {"gameWeek": [{"games": []}]}
+        mock_resp.content = orjson.dumps({"gameWeek": [{"games": []}]})
         with patch("requests.get", return_value=mock_resp):
             pk = provider._get_game_pk(team_id=4, date=sample_date)
         assert pk is None
@@ -157,6 +158,23 @@ class TestNHLGetGamePk:
             pk = provider._get_game_pk(team_id=4, date=sample_date)
         assert pk is None
 
+    def test_schedule_fetched_once_per_team_and_date(self, provider, sample_date):
+        mock_resp = MagicMock()
+        mock_resp.content = orjson.dumps({"gameWeek": [{"games": []}]})
+        with patch("requests.get", return_value=mock_resp) as mock_get:
+            provider._get_game_pk(team_id=4, date=sample_date)
+            provider._get_game_pk(team_id=4, date=sample_date)
+        assert mock_get.call_count == 1
+
+    def test_request_error_is_not_memoised(self, provider, sample_date):
+        import requests as req_lib
+        mock_resp = MagicMock()
+        mock_resp.content = orjson.dumps({"gameWeek": [{"games": []}]})
+        with patch("requests.get", side_effect=[req_lib.exceptions.RequestException("fail"), mock_resp]) as mock_get:
+            provider._get_game_pk(team_id=4, date=sample_date)
+            provider._get_game_pk(team_id=4, date=sample_date)
+        assert mock_get.call_count == 2
+
 
 # ---------------------------------------------------------------------------
 # dump_json (side-effect only — no file written in test)
@@ -165,7 +183,7 @@ class TestNHLGetGamePk:
 class TestNHLDumpJson:
     def test_dump_disabled_by_default(self, provider, nhl_schedule_response, sample_date):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = nhl_schedule_response
+        mock_resp.content = orjson.dumps(nhl_schedule_response)
         with patch("requests.get", return_value=mock_resp):
             with patch.object(provider, "_dump_json") as mock_dump:
                 provider.get_game_scores(sample_date)
@@ -174,7 +192,7 @@ class TestNHLDumpJson:
     def test_dump_called_when_enabled(self, sample_date, nhl_schedule_response):
         provider = NHLDataProvider(dump=True)
         mock_resp = MagicMock()
-        mock_resp.json.return_value = nhl_schedule_response
+        mock_resp.content = orjson.dumps(nhl_schedule_response)
         with patch("requests.get", return_value=mock_resp):
             with patch.object(provider, "_dump_json") as mock_dump:
                 provider.get_game_scores(sample_date)
@@ -188,28 +206,28 @@ class TestNHLDumpJson:
 class TestNHLGetGameScoresNewFields:
     def test_game_type_included_in_regular_season_game(self, provider, nhl_schedule_response, sample_date):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = nhl_schedule_response
+        mock_resp.content = orjson.dumps(nhl_schedule_response)
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_game_scores(sample_date)
         assert result[0]["game_type"] == 2
 
     def test_away_abbrev_included_in_game_dict(self, provider, nhl_schedule_response, sample_date):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = nhl_schedule_response
+        mock_resp.content = orjson.dumps(nhl_schedule_response)
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_game_scores(sample_date)
         assert result[0]["away_abbrev"] == "PHI"
 
     def test_home_abbrev_included_in_game_dict(self, provider, nhl_schedule_response, sample_date):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = nhl_schedule_response
+        mock_resp.content = orjson.dumps(nhl_schedule_response)
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_game_scores(sample_date)
         assert result[0]["home_abbrev"] == "NJD"
 
     def test_regular_season_uses_full_team_name(self, provider, nhl_schedule_response, sample_date):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = nhl_schedule_response
+        mock_resp.content = orjson.dumps(nhl_schedule_response)
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_game_scores(sample_date)
         assert result[0]["away_team"] == "Philadelphia Flyers"
@@ -217,14 +235,14 @@ class TestNHLGetGameScoresNewFields:
 
     def test_series_status_absent_for_regular_season(self, provider, nhl_schedule_response, sample_date):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = nhl_schedule_response
+        mock_resp.content = orjson.dumps(nhl_schedule_response)
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_game_scores(sample_date)
         assert result[0]["series_status"] is None
 
     def test_playoff_game_uses_place_name_only(self, provider, nhl_playoff_schedule_response, sample_date):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = nhl_playoff_schedule_response
+        mock_resp.content = orjson.dumps(nhl_playoff_schedule_response)
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_game_scores(sample_date)
         assert result[0]["away_team"] == "Ottawa"
@@ -232,14 +250,14 @@ class TestNHLGetGameScoresNewFields:
 
     def test_series_status_present_for_playoff_game(self, provider, nhl_playoff_schedule_response, sample_date):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = nhl_playoff_schedule_response
+        mock_resp.content = orjson.dumps(nhl_playoff_schedule_response)
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_game_scores(sample_date)
         assert result[0]["series_status"] is not None
 
     def test_series_status_has_expected_keys(self, provider, nhl_playoff_schedule_response, sample_date):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = nhl_playoff_schedule_response
+        mock_resp.content = orjson.dumps(nhl_playoff_schedule_response)
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_game_scores(sample_date)
         ss = result[0]["series_status"]
@@ -249,7 +267,7 @@ class TestNHLGetGameScoresNewFields:
 
     def test_series_status_values_correctly_mapped(self, provider, nhl_playoff_schedule_response, sample_date):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = nhl_playoff_schedule_response
+        mock_resp.content = orjson.dumps(nhl_playoff_schedule_response)
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_game_scores(sample_date)
         ss = result[0]["series_status"]
@@ -283,7 +301,7 @@ class TestNHLGetAllTeamsForDate:
         self, provider, nhl_schedule_response, sample_date
     ):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = nhl_schedule_response
+        mock_resp.content = orjson.dumps(nhl_schedule_response)
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_all_teams_for_date(sample_date)
         assert (4, "Philadelphia Flyers") in result
@@ -303,7 +321,7 @@ class TestNHLGetAllTeamsForDate:
             }]}]
         }
         mock_resp = MagicMock()
-        mock_resp.json.return_value = preseason_response
+        mock_resp.content = orjson.dumps(preseason_response)
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_all_teams_for_date(sample_date)
         assert result == []
@@ -322,14 +340,14 @@ class TestNHLGetAllTeamsForDate:
             }]}]
         }
         mock_resp = MagicMock()
-        mock_resp.json.return_value = live_response
+        mock_resp.content = orjson.dumps(live_response)
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_all_teams_for_date(sample_date)
         assert result == []
 
     def test_returns_empty_when_no_games(self, provider, sample_date):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {"gameWeek": [{"games": []}]}
+        mock_resp.content = orjson.dumps({"gameWeek": [{"games": []}]})
         with patch("requests.get", return_value=mock_resp):
             result = provider.get_all_teams_for_date(sample_date)
         assert result == []
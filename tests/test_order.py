@@ -1,6 +1,7 @@
 """Unit tests for the ScreamsheetOrder contract and run_order() dispatcher."""
 from __future__ import annotations
 
+import threading
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
@@ -14,6 +15,7 @@ from screamsheet.order import (
     PersonOptions,
     ScreamsheetOrder,
     ScreamsheetResult,
+    SkyOrderOptions,
     TeamEntry,
     OrderValidationError,
     WeatherLocationOptions,
@@ -121,6 +123,42 @@ class TestRunOrder:
         assert any("network timeout" in e for e in result.errors)
         assert result.sheets_generated == []
 
+    def test_concurrent_sheets_are_reported_in_field_order(self) -> None:
+        order = ScreamsheetOrder(
+            nhl=NHLOrderOptions(favorite_teams=[TeamEntry(id=4, name="Flyers")]),
+            nhl_news=NHLNewsOrderOptions(news_names=["Flyers"]),
+            mlb=MLBOrderOptions(favorite_teams=[TeamEntry(id=143, name="Phillies")]),
+        )
+        registry = {
+            "nhl": MagicMock(return_value="/tmp/nhl.pdf"),
+            "nhl_news": MagicMock(side_effect=RuntimeError("feed down")),
+            "mlb": MagicMock(return_value="/tmp/mlb.pdf"),
+        }
+        with patch("screamsheet.runner._REGISTRY", registry):
+            result = run_order(order, today=_TODAY)
+        assert result.sheets_generated == ["mlb.pdf", "nhl.pdf"]
+        assert result.errors == ["nhl_news: feed down"]
+
+    def test_sheets_not_known_thread_safe_run_on_calling_thread(self) -> None:
+        order = ScreamsheetOrder(
+            nhl_news=NHLNewsOrderOptions(news_names=["Flyers"]),
+            sky=SkyOrderOptions(),
+        )
+        threads: dict[str, threading.Thread] = {}
+
+        def handler(name: str) -> MagicMock:
+            def run(*args: object) -> str:
+                threads[name] = threading.current_thread()
+                return f"/tmp/{name}.pdf"
+            return MagicMock(side_effect=run)
+
+        registry = {"nhl_news": handler("nhl_news"), "sky": handler("sky")}
+        with patch("screamsheet.runner._REGISTRY", registry):
+            result = run_order(order, today=_TODAY)
+        assert threads["sky"] is threading.current_thread()
+        assert threads["nhl_news"] is not threading.current_thread()
+        assert sorted(result.sheets_generated) == ["nhl_news.pdf", "sky.pdf"]
+
     def test_subscriber_name_appears_in_result(self) -> None:
         order = ScreamsheetOrder()
         result = run_order(order, today=_TODAY, subscriber_name="Peter Martinson")
@@ -330,6 +330,13 @@ class TestWhiteHouseParseHtml:
 # ---------------------------------------------------------------------------
 
 class TestWhiteHouseGetArticles:
+    def test_fetch_html_requests_html(self):
+        provider = WhiteHouseProvider()
+        with patch("requests.get") as mock_get:
+            mock_get.return_value.text = FAKE_HTML_PRIMARY
+            assert provider._fetch_html() == FAKE_HTML_PRIMARY
+        assert mock_get.call_args.kwargs["headers"] == {"Accept": "text/html"}
+
     def test_fetch_failure_returns_empty_list(self):
         provider = WhiteHouseProvider()
         with patch.object(provider, "_fetch_html", side_effect=ConnectionError("down")):
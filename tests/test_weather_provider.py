@@ -3,7 +3,7 @@ from unittest.mock import patch, MagicMock, call
 
 import pytest
 
-from screamsheet.providers.weather_provider import WeatherProvider, BW_ICON_MAP
+from screamsheet.providers.weather_provider import NWS_HEADERS, WeatherProvider, BW_ICON_MAP
 
 
 @pytest.fixture
@@ -40,6 +40,17 @@ class TestGet5DayForecast:
             result = provider.get_5_day_forecast()
         assert result == []
 
+    def test_nws_requests_send_nws_headers(self, provider, nws_forecast_response):
+        points_mock = MagicMock()
+        points_mock.json.return_value = {"forecast": "https://api.weather.gov/forecast"}
+        forecast_mock = MagicMock()
+        forecast_mock.json.return_value = {"periods": nws_forecast_response["properties"]["periods"]}
+        with patch("requests.get", side_effect=[points_mock, forecast_mock]) as mock_get:
+            assert provider._fetch_forecast_data()
+        for c in mock_get.call_args_list:
+            assert c.kwargs["headers"] == NWS_HEADERS
+            assert c.kwargs["headers"]["Accept"] == "application/ld+json"
+
     def test_day_dict_has_required_keys(self, provider, nws_forecast_response):
         periods = nws_forecast_response["properties"]["periods"]
         with patch.object(provider, "_fetch_forecast_data", return_value=periods):